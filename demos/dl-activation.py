@@ -32,10 +32,6 @@ import time
 import numpy as np
 from tqdm import tqdm
 
-# GUI imports
-from PyQt5.QtWidgets import QApplication, QMainWindow
-from qtgui.widgets.activationview import QActivationView
-
 # toolbox imports
 import dltb.argparse as ToolboxArgparse
 from dltb.base.data import Data
@@ -367,6 +363,12 @@ def main():
     # FIXME[hack]: GUI display
     global show_activations
     if args.gui:
+        # GUI imports: only done when needed, allowing to run the
+        # demo without Qt (e.g., on headless compute nodes).
+        # pylint: disable=import-outside-toplevel
+        from PyQt5.QtWidgets import QApplication, QMainWindow
+        from qtgui.widgets.activationview import QActivationView
+
         global app, window, activationview
         app = QApplication([])
 
@@ -21,12 +21,19 @@ Relation to other `image` modules in the Deep Learning ToolBox:
 
 # standard imports
 from typing import Union, List, Tuple, Dict, Any, Optional, Iterable
+from typing import Callable
 from abc import abstractmethod, ABC
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from enum import Enum
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 import threading
+import functools
+import importlib.util
+import json
 import logging
+import os
 import time
 import math
 
@@ -74,6 +81,9 @@ Sizelike = Union[Tuple[int, int], List[int], str]
 
 
 class Size(namedtuple('Size', ['width', 'height'])):
+    """The size of an image, given as a pair `(width, height)`.
+    """
+    __slots__ = ()
 
     def __new__(cls, size, *args):
         """Allow to instantiate size from any `Sizeable` objects and
@@ -86,8 +96,8 @@ class Size(namedtuple('Size', ['width', 'height'])):
             return super().__new__(cls, size, *args)
 
         if isinstance(size, str):
-            separator = next((sep for sep in size if sep in ",x"), None)
-            size = ((int(number) for number in size.split(separator))
+            separator = ',' if ',' in size else ('x' if 'x' in size else None)
+            size = (tuple(map(int, size.split(separator)))
                     if separator else int(size))
         elif isinstance(size, float):
             size = int(size)
@@ -106,6 +116,71 @@ class Size(namedtuple('Size', ['width', 'height'])):
 Sizelike = Union[Sizelike, Size]
 
 
+# _URL_READERS: a mapping of URL schemes (like 'http') to functions
+# reading an image from a URL of that scheme.  Strings without a
+# scheme are considered to be local filenames (scheme 'file').
+_URL_READERS: Dict[str, Callable[[str], np.ndarray]] = {}
+
+
+def register_url_reader(scheme: str,
+                        reader: Callable[[str], np.ndarray]) -> None:
+    """Register a function for reading images from URLs of a given
+    scheme.  The function will be used by :py:meth:`Image.as_array`.
+
+    Arguments
+    ---------
+    scheme:
+        The URL scheme, e.g. `'http'`.
+    reader:
+        A function taking the URL as argument and returning
+        the image as numpy array.
+    """
+    _URL_READERS[scheme] = reader
+
+
+def _imread(url: str) -> np.ndarray:
+    """Read an image using the :py:func:`dltb.util.image.imread`
+    function.
+    """
+    # FIXME[hack]: local imports to avoid circular module
+    # dependencies ...
+    # pylint: disable=import-outside-toplevel
+    from dltb.util.image import imread
+    if url.startswith('file://'):
+        url = url[len('file://'):]
+    LOG.debug("Loading image '%s' using imread.", url)
+    return imread(url)
+
+
+register_url_reader('file', _imread)
+register_url_reader('http', _imread)
+register_url_reader('https', _imread)
+
+
+@functools.singledispatch
+def _to_array(image: Any, copy: bool) -> Tuple[np.ndarray, bool]:
+    """Convert an image into a numpy array.  Converters are registered
+    for the supported source types (see :py:meth:`Image.add_converter`)
+    and return a pair `(array, copy)`, with `copy` indicating if the
+    array still has to be copied to obtain a copy of the data.
+    """
+    raise NotImplementedError(f"Conversion of {type(image).__module__}"
+                              f".{type(image).__name__} to "
+                              "numpy.ndarray is not implemented")
+
+
+@_to_array.register(str)
+def _url_to_array(image: str, _copy: bool) -> Tuple[np.ndarray, bool]:
+    scheme = image.split('://', 1)[0] if '://' in image else 'file'
+    # a freshly read image never has to be copied
+    return _URL_READERS.get(scheme, _imread)(image), False
+
+
+@_to_array.register(Path)
+def _path_to_array(image: Path, copy: bool) -> Tuple[np.ndarray, bool]:
+    return _url_to_array(str(image), copy)
+
+
 class Colorspace(Enum):
     """Enumeration of potential colorspace for representing images.
     """
@@ -114,6 +189,46 @@ class Colorspace(Enum):
     HSV = 3
 
 
+def rgb_to_hsv(image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Convert an RGB image into the HSV colorspace.  Hue is given
+    in degrees (0-360), saturation and value are in the range 0-1.
+
+    If Numba is available, a compiled kernel is used for the
+    conversion, otherwise the conversion is done by numpy
+    operations on the full image.
+
+    Arguments
+    ---------
+    image:
+        The RGB image, of shape `(H, W, 3)`, either `uint8` or
+        float (range 0-1).
+    out:
+        An optional `float32` array of the same shape, into which
+        the result is written.
+    """
+    if out is None:
+        out = np.empty(image.shape, dtype=np.float32)
+    scale = 1./255. if image.dtype == np.uint8 else 1.
+    if importlib.util.find_spec('numba') is not None:
+        # pylint: disable=import-outside-toplevel
+        from ..thirdparty.numba import rgb_to_hsv as rgb_to_hsv_kernel
+        rgb_to_hsv_kernel(image, scale, out)
+        return out
+
+    rgb = image.astype(np.float32) * scale
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    cmax = rgb.max(axis=-1)
+    delta = cmax - rgb.min(axis=-1)
+    safe_delta = np.where(delta > 0, delta, 1.)
+    hue = np.where(cmax == red, ((green - blue) / safe_delta) % 6.,
+                   np.where(cmax == green, (blue - red) / safe_delta + 2.,
+                            (red - green) / safe_delta + 4.))
+    out[..., 0] = np.where(delta > 0, 60. * hue, 0.)
+    out[..., 1] = np.where(cmax > 0, delta / np.where(cmax > 0, cmax, 1.), 0.)
+    out[..., 2] = cmax
+    return out
+
+
 class Format:
     # pylint: disable=too-few-public-methods
     """Data structure for representing image format. This includes
@@ -133,7 +248,7 @@ class Format:
         """
         if self._min_value is not None:
             return self._min_value
-        if issubclass(self.dtype, (int, np.integer)):
+        if np.dtype(self.dtype).kind in 'iu':
             return 0
         return 0.0
 
@@ -143,7 +258,7 @@ class Format:
         """
         if self._max_value is not None:
             return self._max_value
-        if issubclass(self.dtype, (int, np.integer)):
+        if np.dtype(self.dtype).kind in 'iu':
             return 255
         return 1.0
 
@@ -191,6 +306,8 @@ class Image(DataDict):
             cls.converters[target] = [(source, converter)]
         else:
             cls.converters[target].append((source, converter))
+        if target == 'array':
+            _to_array.register(source, converter)
 
     @classmethod
     def supported_formats(cls) -> Iterable[str]:
@@ -201,12 +318,20 @@ class Image(DataDict):
     @classmethod
     def as_array(cls, image: Imagelike, copy: bool = False,
                  dtype: Optional[type] = None,
-                 colorspace: Colorspace = None) -> np.ndarray:
+                 colorspace: Colorspace = None,
+                 contiguous: bool = False,
+                 readonly: bool = False) -> np.ndarray:
         """Get image-like object as numpy array. This may
         act as the identity function in case `image` is already
         an array, or it may extract the relevant property, or
         it may even load an image from a filename.
 
+        Unless `copy` is `True`, the result may be a view on the
+        original data (or even the original array itself), that is,
+        changing the result may also change the original image.
+        Images read from a file or URL are always returned in a
+        newly allocated array, which is not copied again.
+
         Arguments
         ---------
         image: Imagelike
@@ -220,50 +345,56 @@ class Image(DataDict):
             The colorspace in which the pixels in the resulting
             array are encoded.  If no colorspace is given, or
             if the colorspace of the input image Image is unknown,
-            no color conversion is performed.
-        """
-        for source_class, converter in cls.converters['array']:
-            if isinstance(image, source_class):
-                LOG.debug("Using image converter for type %s (copy=%s)",
-                          type(image), copy)
-                image, copy = converter(image, copy)
-                break
-        else:
-            if isinstance(image, Path):
-                image = str(image)
-            if isinstance(image, str):
-                # FIXME[hack]: local imports to avoid circular module
-                # dependencies ...
-                # pylint: disable=import-outside-toplevel
-                from dltb.util.image import imread
-                LOG.debug("Loading image '%s' using imread.", image)
-                image, copy = imread(image), False
-            else:
-                raise NotImplementedError(f"Conversion of "
-                                          f"{type(image).__module__}"
-                                          f".{type(image).__name__} to "
-                                          "numpy.ndarray is not implemented")
-        LOG.debug("Obtained image of shape %s, dtype=%s.",
-                  image.shape, image.dtype)
-
-        if colorspace == Colorspace.RGB:
+            no color conversion is performed.  Otherwise the input
+            is assumed to be RGB (or grayscale).  HSV images are of
+            dtype `float32` (see :py:func:`rgb_to_hsv`).
+        contiguous: bool
+            A flag indicating that the result should be a C-contiguous
+            array.  Data will only be copied if the array obtained
+            otherwise is not contiguous.
+        readonly: bool
+            A flag indicating that the caller will not write into the
+            result.  This allows to return a read-only view instead
+            of a new array in some cases (e.g., when expanding a
+            grayscale image to RGB).
+        """
+        # fresh: a flag indicating that image is a newly allocated
+        # array, which does not have to be copied again.
+        image, pending = _to_array(image, copy)
+        fresh = copy and not pending
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Obtained image of shape %s, dtype=%s.",
+                      image.shape, image.dtype)
+
+        if colorspace is not None:
             if len(image.shape) == 2:  # grayscale image
-                rgb = np.empty(image.shape + (3,), dtype=image.dtype)
-                rgb[:, :, :] = image[:, :, np.newaxis]
-                image = rgb
-                copy = False
+                # a read-only view, repeating the gray values for
+                # all three channels (materialized below unless the
+                # caller accepts read-only results)
+                image = np.broadcast_to(image[:, :, np.newaxis],
+                                        image.shape + (3,))
+                fresh = False
+                copy = copy or not readonly
             elif len(image.shape) == 3 and image.shape[2] == 4:  # RGBD
                 image = image[:, :, :3]
+            if colorspace is Colorspace.BGR:
+                image = image[:, :, ::-1]
+            elif colorspace is Colorspace.HSV:
+                image = rgb_to_hsv(image)
+                fresh = True
 
         if dtype is not None and dtype != image.dtype:
             image = image.astype(dtype)  # /256.
-            copy = False
+            fresh = True
 
-        if copy:
+        if copy and not fresh:
             image = image.copy()
+        if contiguous:
+            image = np.ascontiguousarray(image, dtype=image.dtype)
 
-        LOG.debug("Returning image of shape %s, dtype=%s.",
-                  image.shape, image.dtype)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Returning image of shape %s, dtype=%s.",
+                      image.shape, image.dtype)
         return image
 
     @staticmethod
@@ -278,6 +409,125 @@ class Image(DataDict):
             data.add_attribute('url', image)
         return data
 
+    @staticmethod
+    def as_normalized(image: Imagelike, mean=0., std=1.,
+                      out: Optional[np.ndarray] = None,
+                      dtype: type = np.float32) -> np.ndarray:
+        """Get a normalized version of an image, that is
+        `(image - mean) / std`.  Conversion of the datatype and
+        normalization are done in a single pass, writing into one
+        output array, without allocating intermediate arrays.
+
+        Arguments
+        ---------
+        image:
+            The image to normalize.
+        mean:
+            The mean value to subtract, either a scalar or a value
+            per channel.
+        std:
+            The standard deviation to divide by, either a scalar or a
+            value per channel.
+        out:
+            An array of the same shape as the image, into which the
+            result is written.  If `None`, a new array is allocated.
+        dtype:
+            The datatype of the result.  Only used if no `out`
+            array is provided.
+        """
+        array = Image.as_array(image)
+        if out is None:
+            out = np.empty(array.shape, dtype=dtype)
+        elif out.shape != array.shape:
+            raise ValueError(f"Output array of shape {out.shape} "
+                             f"does not fit image of shape {array.shape}.")
+        if (array.dtype in (np.uint8, np.uint16) and np.ndim(mean) == 0
+                and np.ndim(std) == 0 and out.flags.c_contiguous):
+            # for 8 and 16 bit images, the normalized values can be
+            # looked up in a table, which is a single pass over the data.
+            np.take(Image._normalization_table(array.dtype, float(mean),
+                                               float(std), out.dtype),
+                    array, out=out, mode='clip')
+            return out
+        np.subtract(array, np.asarray(mean, dtype=out.dtype), out=out,
+                    dtype=out.dtype)
+        np.multiply(out, np.reciprocal(np.asarray(std, dtype=out.dtype)),
+                    out=out)
+        return out
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _normalization_table(source: np.dtype, mean: float, std: float,
+                             target: np.dtype) -> np.ndarray:
+        """A lookup table mapping all values of an unsigned integer
+        dtype (`uint8` or `uint16`) to normalized values `(x-mean)/std`.
+        """
+        values = np.arange(np.iinfo(source).max + 1, dtype=np.float64)
+        return ((values - mean) / std).astype(target)
+
+    @staticmethod
+    def as_nchw(image: Imagelike,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get an image (`HWC`) or a batch of images (`NHWC`) in
+        channel first layout (`CHW` or `NCHW`), as expected by many
+        deep learning frameworks.
+
+        Arguments
+        ---------
+        image:
+            The image or batch of images in channel last layout.
+        out:
+            A C-contiguous array of suitable shape into which the
+            result is written.  If `None`, a new array is allocated.
+
+        Result
+        ------
+        array:
+            A C-contiguous array in channel first layout.
+        """
+        array = Image.as_array(image)
+        axes = (0, 3, 1, 2) if array.ndim == 4 else (2, 0, 1)
+        return Image._transposed(array, axes, out)
+
+    @staticmethod
+    def as_nhwc(image: Imagelike,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get an image (`CHW`) or a batch of images (`NCHW`) in channel
+        first layout into channel last layout (`HWC` or `NHWC`).  This
+        is the inverse operation of :py:meth:`as_nchw`.
+
+        Arguments
+        ---------
+        image:
+            The image or batch of images in channel first layout.
+        out:
+            A C-contiguous array of suitable shape into which the
+            result is written.  If `None`, a new array is allocated.
+
+        Result
+        ------
+        array:
+            A C-contiguous array in channel last layout.
+        """
+        array = Image.as_array(image)
+        axes = (0, 2, 3, 1) if array.ndim == 4 else (1, 2, 0)
+        return Image._transposed(array, axes, out)
+
+    @staticmethod
+    def _transposed(array: np.ndarray, axes: Tuple[int, ...],
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transpose an array into a C-contiguous array.
+        """
+        view = array.transpose(axes)
+        if out is None:
+            return np.ascontiguousarray(view)
+        if out.shape != view.shape or not out.flags.c_contiguous:
+            raise ValueError(f"Output array of shape {out.shape} "
+                             f"(contiguous={out.flags.c_contiguous}) "
+                             f"can not store result of shape {view.shape}.")
+        np.copyto(out, view, casting='unsafe')
+        return out
+
     @classmethod
     def as_shape(cls, image: Imagelike) -> Tuple[int]:
         if isinstance(image, np.ndarray):
@@ -297,11 +547,13 @@ class Image(DataDict):
         # FIXME[todo]: it would be good to have the possibility to
         # indicate desired attributes, e.g. 'array', 'pil', that
         # should be filled during initialization.
-        if isinstance(image, Image) and not copy:
-            return  # just reuse the given Image instance
+        if image is self:
+            return  # __new__ has just returned the given Image instance
+        if image is None:
+            super().__init__(array=array, **kwargs)
+            return
         try:
-            if image is not None:
-                array = self.as_array(image, copy=copy)
+            array = self.as_array(image, copy=copy)
         finally:
             # make sure super().__init__() is called even if
             # preparing the array fails. If ommitted, the object may
@@ -322,17 +574,44 @@ class Image(DataDict):
         # self is a batch of images: create a matrix showing all images.
         rows = int(math.sqrt(len(self)))
         columns = math.ceil(len(self) / rows)
-        from ..util.image import imresize
         if size is None:
-            size = (self[0].shape[1], self[0].shape[0])
+            size = (self[0].array.shape[1], self[0].array.shape[0])
         matrix = np.zeros((size[1]*rows, size[0]*columns, 3),
                           dtype=self[0].array.dtype)
+
+        images = self.array
+        if (isinstance(images, np.ndarray) and
+                images.shape[1:] == (size[1], size[0], 3)):
+            # images already have tile size: place them by writing
+            # into a (rows, columns, height, width, 3) view on matrix
+            tiles = matrix.reshape(rows, size[1], columns, size[0], 3)
+            tiles = tiles.transpose(0, 2, 1, 3, 4)
+            full_rows, rest = divmod(len(images), columns)
+            tiles[:full_rows] = \
+                images[:full_rows*columns].reshape((full_rows, columns) +
+                                                   images.shape[1:])
+            if rest:
+                tiles[full_rows, :rest] = images[full_rows*columns:]
+            return matrix
+
+        # pylint: disable=import-outside-toplevel
+        if (isinstance(images, np.ndarray) and
+                importlib.util.find_spec('numba') is not None):
+            # use a compiled kernel to resize and place all tiles
+            from ..thirdparty.numba import tile_into
+            if images.ndim == 3:
+                images = images[..., np.newaxis]
+            tile_into(images, matrix, size[1], size[0], columns)
+            return matrix
+
+        from ..util.image import imresize
         for idx, image in enumerate(self):
             column = idx % columns
             row = idx // columns
             image = imresize(image.array, size)
             if image.ndim == 2:
-                image = np.expand_dims(image, axis=2).repeat(3, axis=2)
+                # broadcast grayscale values into the three channels
+                image = image[:, :, np.newaxis]
             matrix[row*size[1]:(row+1)*size[1],
                    column*size[0]:(column+1)*size[0]] = image
         return matrix
@@ -344,6 +623,108 @@ class Image(DataDict):
             return Size(*self.shape[1::-1])
 
 
+# register the initial 'array' converters with the dispatcher
+for _source, _converter in Image.converters['array']:
+    _to_array.register(_source, _converter)
+del _source, _converter
+
+
+class ImageBatch:
+    """A batch of images, stored as a structure of arrays: the pixel
+    data of all images is held in one array of shape `(N, H, W, C)`,
+    while the individual image sizes and the urls (filenames) are
+    held in separate arrays.  Images smaller than the batch array
+    are stored in its upper left corner.
+
+    Compared to a list of :py:class:`Image` objects, this allows
+    kernels to operate on one contiguous block of memory.
+
+    Attributes
+    ----------
+    arrays: np.ndarray
+        The pixel data of shape `(N, H, W, C)`.
+    heights: np.ndarray
+        The heights of the individual images (`uint32`).
+    widths: np.ndarray
+        The widths of the individual images (`uint32`).
+    channels: np.ndarray
+        The number of channels of the individual images (`uint32`).
+    urls: List[str]
+        The urls of the images (`None` for images without url).
+    """
+    __slots__ = ('arrays', 'heights', 'widths', 'channels', 'urls')
+
+    def __init__(self, arrays: np.ndarray, heights: np.ndarray = None,
+                 widths: np.ndarray = None, channels: np.ndarray = None,
+                 urls: List[Optional[str]] = None) -> None:
+        if arrays.ndim == 3:
+            arrays = arrays[..., np.newaxis]
+        length = len(arrays)
+        self.arrays = arrays
+        self.heights = np.full(length, arrays.shape[1], dtype=np.uint32) \
+            if heights is None else heights
+        self.widths = np.full(length, arrays.shape[2], dtype=np.uint32) \
+            if widths is None else widths
+        self.channels = np.full(length, arrays.shape[3], dtype=np.uint32) \
+            if channels is None else channels
+        self.urls = [None] * length if urls is None else urls
+
+    @classmethod
+    def from_images(cls, images: Iterable[Imagelike],
+                    dtype: Optional[type] = None) -> 'ImageBatch':
+        """Create an :py:class:`ImageBatch` from a collection of images.
+        The batch array is allocated once, large enough to hold the
+        largest image, and the images are then copied into it.
+
+        Arguments
+        ---------
+        images:
+            The images to be put into the batch.
+        dtype:
+            The dtype of the batch array.  If `None`, the dtype of
+            the first image is used.
+        """
+        images = list(images)
+        urls = [str(image) if isinstance(image, (str, Path)) else
+                (image.filename if isinstance(image, Image) and
+                 image.has_attribute('filename') else None)
+                for image in images]
+        arrays = [Image.as_array(image) for image in images]
+        if not arrays:
+            raise ValueError("Cannot create an empty ImageBatch.")
+        shapes = np.array([array.shape[:2] + (array.shape[2]
+                                              if array.ndim > 2 else 1,)
+                           for array in arrays], dtype=np.uint32)
+        batch = np.zeros((len(arrays),) + tuple(shapes.max(axis=0)),
+                         dtype=arrays[0].dtype if dtype is None else dtype)
+        for index, array in enumerate(arrays):
+            height, width, channels = shapes[index]
+            np.copyto(batch[index, :height, :width, :channels],
+                      array.reshape(height, width, channels),
+                      casting='unsafe')
+        return cls(batch, heights=shapes[:, 0], widths=shapes[:, 1],
+                   channels=shapes[:, 2], urls=urls)
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """The `index`-th image of this batch, as a view on the
+        batch array.
+        """
+        return self.arrays[index, :self.heights[index], :self.widths[index],
+                           :self.channels[index]]
+
+    @property
+    def uniform(self) -> bool:
+        """A flag indicating that all images in this batch fill
+        the full batch array.
+        """
+        return bool((self.heights == self.arrays.shape[1]).all() and
+                    (self.widths == self.arrays.shape[2]).all() and
+                    (self.channels == self.arrays.shape[3]).all())
+
+
 class ImageAdapter(ABC):
     """If an object is an ImageAdapter, it can adapt images to
     some internal representation. It has to implement the
@@ -352,56 +733,137 @@ class ImageAdapter(ABC):
     image processing.
 
     The :py:class:`ImageAdapter` keeps a map of known
-    :py:class:`ImageExtension`. If a subclass of
-    :py:class:`ImageAdapter` also subclasses a base class of these
-    extensions it will be adapted to also subclass the corresponding
-    extension, e.g., a :py:class:`ImageAdapter` that is a `Tool` will
-    become an `ImageTool`, provided the mapping of `Tool` to
-    `ImageTool` has been registered with the `ImageAdapter` class.
-    Creating `ImageTool` as an :py:class:`ImageExtension` of
-    `base=Tool` will automatically do the registration.
+    :py:class:`ImageExtension`s, mapping a base class (like `Tool`)
+    to its image extension (like `ImageTool`).  Creating `ImageTool`
+    as an :py:class:`ImageExtension` of `base=Tool` will automatically
+    do the registration.  A class that wants to be both, an
+    :py:class:`ImageAdapter` and (for example) a `Tool`, should
+    explicitly derive from the extension (`ImageTool`).
     """
 
     _image_extensions: Dict[type, type] = {}
 
-    def __init_subclass__(cls, **kwargs) -> None:
-        super().__init_subclass__(**kwargs)
+    # dtype: the datatype of the internal representation provided by
+    # image_to_internal().
+    dtype: np.dtype = np.uint8
 
-        for base, replacement in ImageAdapter._image_extensions.items():
-            if base in cls.__mro__ and replacement not in cls.__mro__:
-                new_bases = []
-                found = False
-                for base_class in cls.__bases__:
-                    if base_class is base:
-                        found = True
-                        new_bases.append(replacement)
-                        continue
-                    if not found and issubclass(base_class, base):
-                        new_bases.append(replacement)
-                        found = True
-                    new_bases.append(base_class)
-                LOG.debug("ImageAdapter.__init_subclass__(%s): %s -> %s",
-                          cls, cls.__bases__, new_bases)
-                cls.__bases__ = tuple(new_bases)
+    # normalized_dtype: the (floating point) datatype of data
+    # provided by device_normalize(), e.g. np.float16 for mixed
+    # precision models.  Backends may also support 'bfloat16'.
+    normalized_dtype: Union[np.dtype, str] = np.float32
 
-    def image_to_internal(self, image: Imagelike) -> np.ndarray:
+    # internal_shape: the shape of a single image in the internal
+    # representation, if fixed (allows to preallocate batch arrays).
+    internal_shape: Optional[Tuple[int, ...]] = None
+
+    # batch_supported: a flag indicating that _image_to_internal()
+    # can process a batch of images (an array of shape NHWC) at once.
+    batch_supported: bool = False
+
+    # reuse_internal_buffer: a flag indicating that image_to_internal()
+    # may write batches into a buffer that is reused across calls
+    # (requires internal_shape).  Results are then only valid until
+    # the next call and have to be copied if they are to be kept.
+    reuse_internal_buffer: bool = False
+    _internal_buffer: Optional[np.ndarray] = None
+
+    @staticmethod
+    def image_extension(base: type) -> Optional[type]:
+        """Get the :py:class:`ImageExtension` registered for a given
+        base class.
+
+        Result
+        ------
+        extension:
+            The extension class or `None` if no extension was
+            registered for `base`.
         """
+        return ImageAdapter._image_extensions.get(base)
+
+    def image_to_internal(self, image: Imagelike) -> np.ndarray:
+        """Convert an image or a batch of images into the internal
+        representation, a batch array in `NHWC` format.
+
+        The dtype of the result should be :py:attr:`dtype`, which
+        is `uint8` unless declared otherwise by a subclass.  Keeping
+        images as `uint8` reduces the amount of data to be transferred
+        (e.g., to a GPU), while the conversion to float can be
+        done later by :py:meth:`device_normalize`.
         """
         # FIXME[hack]: batch handling
         from dltb.base.data import Data
         if isinstance(image, Data) and image.is_batch:
-            result = np.ndarray((len(image), 227, 227, 3))
-            for index, img in enumerate(image.array):
-                result[index] = self._image_to_internal(img)
-            return result
+            image = image.array
         elif isinstance(image, list):
-            result = np.ndarray((len(image), 227, 227, 3))
-            for index, img in enumerate(image):
-                result[index] = self._image_to_internal(img)
-            return result
+            if self.batch_supported:
+                image = np.stack([Image.as_array(img) for img in image])
+        else:
+            image = self._image_to_internal(image)
+            return image[np.newaxis]
 
-        image = self._image_to_internal(image)
-        return image[np.newaxis]
+        # image is now a batch (list or array) of images
+        if self.batch_supported:
+            return self._image_to_internal(image)
+
+        if self.internal_shape is not None:
+            result = self._internal_batch(len(image))
+            start = 0
+        else:
+            first = self._image_to_internal(image[0])
+            result = np.empty((len(image),) + first.shape, dtype=first.dtype)
+            result[0] = first
+            start = 1
+        for index in range(start, len(image)):
+            result[index] = self._image_to_internal(image[index])
+        return result
+
+    def _internal_batch(self, length: int) -> np.ndarray:
+        """Provide an array to hold a batch of `length` images in
+        internal representation.  If :py:attr:`reuse_internal_buffer`
+        is set, this is a view on a buffer that is only reallocated
+        when a larger batch is requested.
+        """
+        shape = (length,) + self.internal_shape
+        if not self.reuse_internal_buffer:
+            return np.empty(shape, dtype=self.dtype)
+        buffer = self._internal_buffer
+        if (buffer is None or len(buffer) < length or
+                buffer.shape[1:] != self.internal_shape or
+                buffer.dtype != self.dtype):
+            buffer = np.empty(shape, dtype=self.dtype)
+            self._internal_buffer = buffer
+        return buffer[:length]
+
+    def device_normalize(self, data: Any, mean, std) -> Any:
+        """Normalize data obtained by :py:meth:`image_to_internal`,
+        that is convert `uint8` values (range 0-255) to float values
+        in the range 0.0-1.0 and then normalize them, i.e.,
+        `(data/255 - mean) / std`.
+
+        Subclasses working with some computation device (like a GPU)
+        should overwrite this method to do the conversion on the
+        device, so that only `uint8` data have to be transferred.
+
+        Arguments
+        ---------
+        data:
+            The (batch of) images in channel last format.
+        mean:
+            The mean value (scalar or per channel) with respect to
+            the range 0.0-1.0.
+        std:
+            The standard deviation (scalar or per channel) with respect
+            to the range 0.0-1.0.
+
+        Result
+        ------
+        normalized:
+            The normalized data, of type :py:attr:`normalized_dtype`.
+        """
+        # (data/255 - mean) / std == (data - 255*mean) / (255*std)
+        return Image.as_normalized(data, mean=np.multiply(mean, 255.),
+                                   std=np.multiply(std, 255.),
+                                   dtype=self.normalized_dtype)
 
     @abstractmethod
     def _image_to_internal(self, image: Imagelike) -> Any:
@@ -418,23 +880,24 @@ class ImageExtension(ImageAdapter, ABC):
     process images. In that it makes use of the :py:class:`ImageAdapter`
     interface.
 
-    In addition to deriving from :py:class:`ImageAdapter`, the
-    :py:class:`ImageExtension` introduces some "behind the scene
-    magic": a class `ImageTool` that is declared as an `ImageExtension`
-    with base `Tool` is registered with the :py:class:`ImageAdapter`
-    class, so that any common subclass of :py:class:`ImageAdapter`
-    and `Tool` will automagically become an `ImageTool`.
+    An :py:class:`ImageExtension` is declared by providing the
+    class to be extended as `base` argument.  The extension should
+    also list that base class among its base classes, e.g.,
+
+    >>> class ImageTool(ImageExtension, Tool, base=Tool):
+
+    The extension is then registered with the :py:class:`ImageAdapter`
+    class (see :py:meth:`ImageAdapter.image_extension`).
     """
 
     def __init_subclass__(cls, base: type = None, **kwargs) -> None:
         # pylint: disable=arguments-differ
         super().__init_subclass__(**kwargs)
         if base is not None:
-            new_bases = [ImageAdapter, base]
-            for base_class in cls.__bases__:
-                if base_class is not ImageExtension:
-                    new_bases.append(base_class)
-            cls.__bases__ = tuple(new_bases)
+            if not issubclass(cls, base):
+                raise TypeError(f"ImageExtension {cls.__name__} "
+                                f"should be a subclass of its base "
+                                f"{base.__name__}.")
             ImageAdapter._image_extensions[base] = cls
 
 
@@ -460,6 +923,7 @@ class ImageIO:
     # pylint: disable=too-few-public-methods
     """An abstract interface to read, write and display images.
     """
+    __slots__ = ()
 
 
 class ImageReader(ImageIO, Implementable):
@@ -467,6 +931,9 @@ class ImageReader(ImageIO, Implementable):
     The :py:meth:`read` method is the central method of this class.
     """
 
+    # _prefetch_executor: a thread pool used by prefetch_next()
+    _prefetch_executor: Optional[ThreadPoolExecutor] = None
+
     def __str__(self) -> str:
         return type(self).__module__ + '.' + type(self).__name__
 
@@ -477,6 +944,102 @@ class ImageReader(ImageIO, Implementable):
                                   "be an ImageReader, but does not implement "
                                   "the read method.")
 
+    @staticmethod
+    def configure_prefetch(prefetch: int = 2) -> None:
+        """Set the number of images that can be read concurrently
+        by :py:meth:`prefetch_next`.
+        """
+        executor = ImageReader._prefetch_executor
+        ImageReader._prefetch_executor = \
+            ThreadPoolExecutor(max_workers=prefetch,
+                               thread_name_prefix='ImageReader')
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def prefetch_next(self, filenames: Iterable[str],
+                      **kwargs) -> List[Future]:
+        """Asynchronously read images in background threads, allowing
+        to overlap reading (decoding) images with other computation.
+
+        Arguments
+        ---------
+        filenames:
+            The names of the files (or URLs) to read.
+
+        Result
+        ------
+        futures:
+            A list of futures, one per filename, that will provide
+            the image arrays.
+        """
+        if ImageReader._prefetch_executor is None:
+            ImageReader.configure_prefetch()
+        executor = ImageReader._prefetch_executor
+        return [executor.submit(self.read, filename, **kwargs)
+                for filename in filenames]
+
+    def read_batch(self, filenames: Iterable[str],
+                   shape: Optional[Tuple[int, ...]] = None,
+                   dtype: type = np.uint8, out: Optional[np.ndarray] = None,
+                   cache: Optional['MemmapImageCache'] = None,
+                   **kwargs) -> np.ndarray:
+        """Read a batch of images into a single (preallocated) array.
+        All images are required to have the same shape.
+
+        Arguments
+        ---------
+        filenames:
+            The names of the files (or URLs) to read.
+        shape:
+            The shape of an individual image.  If `None`, the shape
+            will be taken from `out` or, if that is also `None`, from
+            the first image read.
+        dtype:
+            The datatype of the batch array.  Only used if no `out`
+            array is provided.
+        out:
+            A C-contiguous array of shape `(N,) + shape` into which the
+            images are written.  If `None`, a new array is allocated.
+        cache:
+            A :py:class:`MemmapImageCache` from which images are taken
+            (if already cached) or into which they are stored after
+            reading.  The images will have the shape of the cache.
+
+        Result
+        ------
+        batch:
+            An array of shape `(N,) + shape` holding the images.
+        """
+        filenames = list(filenames)
+        first = None
+        if cache is not None:
+            shape = cache.shape if shape is None else shape
+            read = functools.partial(cache.get_or_decode, reader=self)
+        else:
+            read = self.read
+        if out is None:
+            if shape is None:
+                if not filenames:
+                    raise ValueError("Cannot determine the image shape "
+                                     "for an empty batch.")
+                first = read(filenames[0], **kwargs)
+                shape = first.shape
+            out = np.empty((len(filenames),) + tuple(shape), dtype=dtype)
+        elif len(out) != len(filenames) or not out.flags.c_contiguous:
+            raise ValueError(f"Batch array of shape {out.shape} "
+                             f"(contiguous={out.flags.c_contiguous}) "
+                             f"is not suitable for {len(filenames)} images.")
+
+        for index, filename in enumerate(filenames):
+            image = (read(filename, **kwargs)
+                     if first is None or index > 0 else first)
+            if image.shape != out.shape[1:]:
+                raise ValueError(f"Image '{filename}' of shape {image.shape} "
+                                 f"does not fit into batch of shape "
+                                 f"{out.shape}.")
+            np.copyto(out[index], image, casting='unsafe')
+        return out
+
 
 class ImageWriter(ImageIO, Implementable):
     """An :py:class:`ImageWriter` can write iamges to files or upload them
@@ -656,8 +1219,26 @@ class ImageResizer(Implementable):
 
     """
 
-    def resize(self, image: np.ndarray,
-               size: Size, **_kwargs) -> np.ndarray:
+    @classmethod
+    def configure(cls, num_threads: int = 1) -> None:
+        """Configure the use of threads for image resizing.  When
+        resizing is done in a data pipeline that already runs several
+        workers in parallel, multi-threaded resizing will oversubscribe
+        the CPU, and hence it is advisable to restrict each resizer to
+        one thread.  Implementations based on a multi-threaded library
+        should overwrite this method to pass the setting to that
+        library; the default implementation does nothing.  Background
+        reading of images is configured separately by
+        :py:meth:`ImageReader.configure_prefetch`.
+
+        Arguments
+        ---------
+        num_threads:
+            The number of threads to be used by the resizing library.
+        """
+
+    def resize(self, image: Imagelike, size: Sizelike,
+               **kwargs) -> np.ndarray:
         """Resize an image to the given size.
 
         Arguments
@@ -665,17 +1246,11 @@ class ImageResizer(Implementable):
         image:
             The image to be scaled.
         size:
-            The target size.
+            The target size, given as `(width, height)`.
         """
-        if type(self).scale is ImageResizer.scale:
-            raise NotImplementedError(f"{type(self)} claims to be an "
-                                      "ImageResizer, but does not implement "
-                                      "the resize method.")
-        image_size = image.shape[:2]
-        scale = (size[0]/image_size[0], size[1]/image_size[1])
-        return self.scale(image, scale=scale)
+        return self._resize(Image.as_array(image), Size(size), **kwargs)
 
-    def scale(self, image: np.ndarray,
+    def scale(self, image: Imagelike,
               scale: Union[float, Tuple[float, float]],
               **kwargs) -> np.ndarray:
         """Scale an image image by a given factor.
@@ -687,35 +1262,117 @@ class ImageResizer(Implementable):
         scale:
             Either a single float value being the common
             scale factor for horizontal and vertical direction, or
-            a pair of scale factors for these two axes.
+            a pair of scale factors for these two axes (horizontal
+            first).
         """
-        if type(self).resize is ImageResizer.resize:
-            raise NotImplementedError(f"{type(self)} claims to be an "
-                                      "ImageResizer, but does not implement "
-                                      "the scale method.")
-
-        if isinstance(scale, float):
+        if isinstance(scale, (int, float)):
             scale = (scale, scale)
 
-        image_size = image.shape[:2]
-        size = Size(int(image_size[0] * scale[0]),
-                    int(image_size[1] * scale[1]))
-        return self.resize(image, size=size, **kwargs)
+        image = Image.as_array(image)
+        size = Size(int(image.shape[1] * scale[0]),
+                    int(image.shape[0] * scale[1]))
+        return self._resize(image, size, **kwargs)
+
+    def specialize(self, shape: Tuple[int, ...], size: Sizelike,
+                   dtype: type = np.uint8) -> Callable[[np.ndarray],
+                                                       np.ndarray]:
+        """Obtain a resize function specialized for images of a fixed
+        shape and a fixed target size.  This avoids recomputing
+        parameters on every call, which is useful in data pipelines
+        in which all images have the same shape.
+
+        Subclasses may return a function that writes into an output
+        buffer that is reused across invocations: the caller has to
+        copy the result if it is to be retained beyond the next call.
+
+        Arguments
+        ---------
+        shape:
+            The shape `(H, W)` or `(H, W, C)` of the input images.
+        size:
+            The target size, given as `(width, height)`.
+        dtype:
+            The dtype of the input images.
+
+        Result
+        ------
+        resizer:
+            A function mapping an image of the given shape to the
+            resized image.
+        """
+        # pylint: disable=unused-argument
+        size = Size(size)
+        return lambda image: self._resize(image, size)
+
+    def _resize(self, image: np.ndarray, size: Size, **kwargs) -> np.ndarray:
+        """Resize an image to the given size.  This is the method
+        to be implemented by subclasses: both :py:meth:`resize`
+        and :py:meth:`scale` directly delegate to this method.
+
+        Arguments
+        ---------
+        image:
+            The image to be resized, already converted to a numpy array.
+        size:
+            The target size, given as `(width, height)`.
+        """
+        raise NotImplementedError(f"{type(self)} claims to be an "
+                                  "ImageResizer, but does not implement "
+                                  "the _resize method.")
 
     @staticmethod
     def crop(image: Imagelike, size: Size, **_kwargs) -> np.ndarray:
         """Crop an :py:class:`Image` to a given size.
 
         If no position is provided, a center crop will be performed.
+        The image may also be a batch of images (an array of shape
+        `(N, H, W, C)`), in which case all images are cropped.
+        The result is a view on the original image data.
         """
         # FIXME[todo]: deal with sizes extending the original size
         # FIXME[todo]: allow center/random/position crop
-        image = Image.as_array(image)
-        old_size = image.shape[:2]
-        center = old_size[0]//2, old_size[1]//2
-        point1 = center[0] - size[0]//2, center[1] - size[1]//2
-        point2 = point1[0] + size[0], point1[1] + size[1]
-        return image[point1[0]:point2[0], point1[1]:point2[1]]
+        # pylint: disable=unidiomatic-typecheck
+        if type(image) is not np.ndarray:  # avoid converter lookup
+            image = Image.as_array(image)
+        if image.ndim == 4:  # batch of images
+            return image[(slice(None),) +
+                         ImageResizer._center_window(image.shape[1:3], size)]
+        return image[ImageResizer._center_window(image.shape, size)]
+
+    @staticmethod
+    def center_cropper(shape: Tuple[int, ...],
+                       size: Size) -> Callable[[np.ndarray], np.ndarray]:
+        """Obtain a function performing a center crop for images of a
+        fixed shape.  The crop window is computed only once, so the
+        function is suitable for use inside a data loading loop.
+
+        Arguments
+        ---------
+        shape:
+            The shape of the images to be cropped. Only the first
+            two axes (height and width) are relevant.
+        size:
+            The size of the crop, as used by :py:meth:`crop`.
+
+        Result
+        ------
+        cropper:
+            A function mapping an image to a (view on) the cropped
+            image.
+        """
+        window = ImageResizer._center_window(shape, size)
+        return lambda image: image[window]
+
+    @staticmethod
+    def _center_window(shape: Tuple[int, ...],
+                       size: Size) -> Tuple[slice, slice]:
+        """The slices describing a center crop of the given size.
+        A size exceeding the shape results in the full extent of
+        that axis (the crop is not padded).
+        """
+        row1 = max(shape[0]//2 - size[0]//2, 0)
+        column1 = max(shape[1]//2 - size[1]//2, 0)
+        return slice(row1, row1 + size[0]), slice(column1, column1 + size[1])
 
 
 class ImageWarper(Implementable):
@@ -796,25 +1453,178 @@ class ImageWarper(Implementable):
         return cls.align(image, transformation, size)
 
 
+class MemmapImageCache:
+    """A persistent cache for decoded images, stored in a memory mapped
+    numpy (`.npy`) file.  All images in the cache have the same
+    (canonical) shape, images of other shape are resized when
+    being added to the cache.  Subsequent reads of a cached image
+    just slice the memory mapped array, avoiding to decode the image
+    file again.
+
+    The mapping of image filenames to slots of the cache array is
+    stored in a sidecar JSON file (the cache filename with suffix
+    `.json`).  This index is written by :py:meth:`flush`, which
+    hence should be called before the cache is discarded.
+
+    >>> cache = MemmapImageCache('images.npy', shape=(227, 227, 3),
+    ...                          capacity=10000)
+    >>> image = cache.get_or_decode('dog.jpg', ImageReader())
+    >>> cache.flush()
+
+    Attributes
+    ----------
+    _array: np.memmap
+        The memory mapped array of shape `(capacity,) + shape`.
+    _index: Dict[str, int]
+        The mapping of filenames to indices into `_array`.
+    """
+
+    def __init__(self, filename: Union[str, Path], shape: Tuple[int, ...],
+                 capacity: int, dtype: type = np.uint8) -> None:
+        self._filename = Path(filename)
+        self._index_filename = self._filename.with_suffix('.json')
+        self._resizer = None
+        if self._filename.exists():
+            self._array = \
+                np.lib.format.open_memmap(self._filename, mode='r+')
+            if self._array.shape[1:] != tuple(shape):
+                raise ValueError(f"Cache file '{self._filename}' has "
+                                 f"shape {self._array.shape[1:]}, "
+                                 f"expected {tuple(shape)}.")
+        else:
+            self._array = \
+                np.lib.format.open_memmap(self._filename, mode='w+',
+                                          shape=(capacity,) + tuple(shape),
+                                          dtype=dtype)
+        self._index: Dict[str, int] = {}
+        if self._index_filename.exists():
+            with open(self._index_filename, encoding='utf-8') as file:
+                self._index = json.load(file)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, filename: Union[str, Path]) -> bool:
+        return str(filename) in self._index
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The (canonical) shape of the images in this cache.
+        """
+        return self._array.shape[1:]
+
+    def get_or_decode(self, filename: Union[str, Path],
+                      reader: Optional[ImageReader] = None,
+                      **kwargs) -> np.ndarray:
+        """Obtain an image from the cache.  If the image is not cached
+        yet, it is read by the given :py:class:`ImageReader` and
+        added to the cache.
+
+        Result
+        ------
+        image:
+            The image, resized to the shape of this cache.  This will
+            usually be a view on the memory mapped cache array, which
+            should not be modified.
+        """
+        key = str(filename)
+        index = self._index.get(key)
+        if index is not None:
+            return self._array[index]
+
+        if reader is None:
+            reader = ImageReader()
+        image = reader.read(key, **kwargs)
+        if image.shape != self.shape:
+            if self._resizer is None:
+                self._resizer = ImageResizer()
+            image = self._resizer.resize(image, Size(self.shape[1],
+                                                     self.shape[0]))
+
+        index = len(self._index)
+        if index >= len(self._array):
+            LOG.warning("MemmapImageCache '%s' is full (capacity=%d), "
+                        "not caching '%s'.", self._filename,
+                        len(self._array), key)
+            return image
+        self._array[index] = image
+        self._index[key] = index
+        return self._array[index]
+
+    def flush(self) -> None:
+        """Write the cache data and the index to disk.
+        """
+        self._array.flush()
+        with open(self._index_filename, 'w', encoding='utf-8') as file:
+            json.dump(self._index, file)
+
+
 class ImageOperator:
     """An :py:class:`ImageOperator` can be applied to an image to
     obtain some transformation of that image.
+
+    Operators should be implemented as operations on the full
+    image array (numpy or numba functions), not by looping over
+    individual pixels in Python.  If the operation can be expressed
+    as a (generalized) universal function, accepting an `out`
+    argument, subclasses may just implement :py:meth:`as_ufunc`,
+    allowing the operation to be applied in place.
     """
+    __slots__ = ()
 
     def __call__(self, image: np.ndarray) -> np.ndarray:
         """Perform the actual operation.
         """
-        raise NotImplementedError(f"{self.__class__.__name__} claims to "
-                                  "be an ImageOperator, but does not "
-                                  "implement the `__call__` method.")
+        function = self.as_ufunc()
+        if function is None:
+            raise NotImplementedError(f"{self.__class__.__name__} claims to "
+                                      "be an ImageOperator, but does not "
+                                      "implement the `__call__` method.")
+        return function(image)
+
+    def as_ufunc(self) -> Optional[Callable]:
+        """Provide this operator as a universal function, that is
+        a function operating on the full image array and accepting an
+        `out` argument (like a `numpy.ufunc` or a `numba.vectorize`d
+        function).  `None` means that the operator can not be expressed
+        in that way.
+        """
+        return None
+
+    @staticmethod
+    def _apply_inplace(image: np.ndarray, function: Callable) -> np.ndarray:
+        """Apply a universal function to an image, writing the result
+        back into the image array.
+
+        Arguments
+        ---------
+        image:
+            The image array, which will be overwritten.
+        function:
+            A universal function accepting an `out` argument.  The
+            dtype of its result has to be castable to the dtype
+            of the image.  A :py:class:`TypeError` is raised if
+            `function` is not a universal function.
+        """
+        if not hasattr(function, 'nin'):
+            raise TypeError(f"{function} is not a universal function.")
+        return function(image, out=image)
 
     def transform(self, source: str, target: str) -> None:
-        """Transform a source file into a target file.
+        """Transform a source file into a target file.  If the
+        operator provides a universal function, the image is
+        transformed in place, otherwise a new array is created.
         """
         # FIXME[concept]: this requires the util.image module!
         # pylint: disable=import-outside-toplevel
         from ..util.image import imread, imwrite
-        imwrite(target, self(imread(source)))
+        image = imread(source)
+        function = self.as_ufunc()
+        if function is None:
+            image = self(image)
+        else:
+            self._apply_inplace(image, function)
+        imwrite(target, image)
 
     def transform_data(self, image: Image,
                        target: str, source: str = None) -> None:
@@ -822,6 +1632,60 @@ class ImageOperator:
         """
         image.add_attribute(target, value=self(image.get_attribute(source)))
 
+    def call_batch(self, batch: ImageBatch) -> ImageBatch:
+        """Apply this :py:class:`ImageOperator` to a batch of images.
+        The default implementation applies the operator to each
+        image individually.  Subclasses operating on the contiguous
+        batch array may overwrite this method.
+        """
+        result = ImageBatch.from_images([self(image) for image in batch])
+        result.urls = list(batch.urls)
+        return result
+
+
+# _DISPLAY_CACHE: images recently read from files for display, keyed
+# on filename and modification time, and ordered by last use.  This
+# avoids decoding the same file again when it is shown repeatedly.
+_DISPLAY_CACHE: 'OrderedDict[Tuple[str, float], np.ndarray]' = OrderedDict()
+_DISPLAY_CACHE_SIZE = 8
+_DISPLAY_CACHE_LOCK = threading.Lock()
+
+
+def _display_array(image: Imagelike) -> np.ndarray:
+    """Obtain an image to be displayed as numpy array.  Images
+    from local files are cached.  The cached arrays are shared
+    between all calls (and displays) showing the same file, and
+    are hence read-only: callers must not modify them, but copy
+    the array if they need a modified version.
+    """
+    if isinstance(image, np.ndarray):
+        return image  # fast path for frames that are already arrays
+    if isinstance(image, Path):
+        image = str(image)
+    if not isinstance(image, str) or \
+            ('://' in image and not image.startswith('file://')):
+        return Image.as_array(image)
+
+    filename = image[len('file://'):] if '://' in image else image
+    try:
+        key = (filename, os.stat(filename).st_mtime)
+    except OSError:
+        # let the image reader report the problem
+        return Image.as_array(image)
+    with _DISPLAY_CACHE_LOCK:
+        array = _DISPLAY_CACHE.get(key)
+        if array is not None:
+            _DISPLAY_CACHE.move_to_end(key)
+            return array
+
+    array = Image.as_array(image)
+    array.setflags(write=False)
+    with _DISPLAY_CACHE_LOCK:
+        _DISPLAY_CACHE[key] = array
+        while len(_DISPLAY_CACHE) > _DISPLAY_CACHE_SIZE:
+            _DISPLAY_CACHE.popitem(last=False)
+    return array
+
 
 class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
     """An :py:class:`ImageDisplay` can display images.  Typically, it will
@@ -956,9 +1820,37 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         # event loop.  If None, then currently no event loop is running.
         self._event_loop = None
 
-        # _presentation: a Thread object running a presentation, initiated
-        # by the method `present`
-        self._presentation: Optional[threading.Thread] = None
+        # _event_loop_future: the Future of a background event loop
+        # started by this display (None if the event loop runs in
+        # a thread that called show() or present())
+        self._event_loop_future: Optional[Future] = None
+
+        # _presentation: the Future of a presentation, initiated
+        # by the method `present` and running in a background thread
+        self._presentation: Optional[Future] = None
+
+        # _presenter: the Thread running the presentation
+        self._presenter: Optional[threading.Thread] = None
+
+        # _frame_buffer: a uint8 array into which images of other
+        # dtype are converted before display. The buffer is reused
+        # as long as the image shape does not change.
+        self._frame_buffer: Optional[np.ndarray] = None
+
+        # _last_shown: a signature (data address, shape, strides, dtype,
+        # version) of the last image passed to _show, allowing to skip
+        # repeated display of the same image version.
+        self._last_shown: Optional[tuple] = None
+
+        # _wake: an event set to interrupt the wait of the dummy event
+        # loop, e.g., when the display is closed or a new image is shown
+        self._wake = threading.Event()
+
+        # _show_frame, _process_frame_events: the bound methods _show
+        # and _process_events, looked up once, as they are called for
+        # every frame by show() and the dummy event loop
+        self._show_frame = self._show
+        self._process_frame_events = self._process_events
 
     @property
     def blocking(self) -> bool:
@@ -991,13 +1883,15 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         self._entered += 1
         if self._entered > 1:
             LOG.warning("Entering Display multiple times: %d", self._entered)
-        else:
+        elif LOG.isEnabledFor(logging.DEBUG):
             LOG.debug("Entering Display")
-        self.open()
+        if not self._opened:
+            self.open()
         return self
 
     def __exit__(self, _exception_type, _exception_value, _traceback) -> None:
-        LOG.debug("Exiting Display (%d)", self._entered)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Exiting Display (%d)", self._entered)
         self._entered -= 1
         if self._entered == 0:
             self.close()
@@ -1007,7 +1901,8 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
     #
 
     def show(self, image: Imagelike, blocking: bool = None, close: bool = None,
-             timeout: float = None, **kwargs) -> None:
+             timeout: float = None, version: Optional[int] = None,
+             **kwargs) -> None:
         """Display the given image.
 
         This method may optionally pause execution of the main program
@@ -1037,6 +1932,13 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
             and wait or a key press.
         timeout: float
             Time in seconds to pause execution.
+        version: int
+            A version number of the image, to be increased by the
+            caller whenever the image data change.  If the same
+            image is shown again with an unchanged version, it is
+            not passed to the display again, only pending events
+            are processed.  If no version is given, the image is
+            always displayed.
 
         """
         if self._presentation is not None:
@@ -1049,18 +1951,40 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
 
         # make sure the window is open
         if self.closed:
-            if self._presentation is threading.current_thread():
+            if self._presenter is threading.current_thread():
                 raise RuntimeError("Presentation is trying to use closed "
                                    "ImageDisplay.")
             self.open()
 
         # show the image
-        array = Image.as_array(image, dtype=np.uint8)
-        LOG.debug("Showing image of shape %s, blocking=%s, close=%s, "
-                  "timout=%s, event loop=%s, presentation=%s",
-                  array.shape, blocking, close, timeout,
-                  self.event_loop_is_running(), self._presentation is not None)
-        self._show(array, **kwargs)
+        array = _display_array(image)
+        # The signature only uses array metadata: hashing the pixel
+        # data would cost about as much as displaying the frame.
+        signature = (None if version is None else
+                     (array.ctypes.data, array.shape, array.strides,
+                      array.dtype, version))
+        if (signature is not None and signature == self._last_shown and
+                not close and timeout is None and blocking is not True):
+            if blocking is None:
+                self._process_frame_events()
+            return
+        if array.dtype != np.uint8:
+            if (self._frame_buffer is None or
+                    self._frame_buffer.shape != array.shape):
+                self._frame_buffer = np.empty(array.shape, dtype=np.uint8)
+            np.copyto(self._frame_buffer, array, casting='unsafe')
+            array = self._frame_buffer
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Showing image of shape %s, blocking=%s, close=%s, "
+                      "timout=%s, event loop=%s, presentation=%s",
+                      array.shape, blocking, close, timeout,
+                      self.event_loop_is_running(),
+                      self._presentation is not None)
+        self._show_frame(array, **kwargs)
+        self._last_shown = signature
+        # signal the new frame to a waiting event loop, so that it is
+        # processed (painted) without waiting for the next poll
+        self._wake.set()
 
         # run the event loop
         if blocking is True:
@@ -1073,7 +1997,7 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
             if not self.event_loop_is_running():
                 self._run_nonblocking_event_loop()
         elif blocking is None:
-            self._process_events()
+            self._process_frame_events()
 
         # close the window if desired
         if close:
@@ -1102,6 +2026,7 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         def target() -> None:
             # pylint: disable=broad-except
             LOG.info("ImageDisplay[background]: calling presenter")
+            self._presenter = threading.current_thread()
             try:
                 presenter(self, *args, **kwargs)
             except BaseException as exception:
@@ -1112,8 +2037,10 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
 
         with self:
             LOG.info("ImageDisplay[main]: Starting presentation")
-            self._presentation = threading.Thread(target=target)
-            self._presentation.start()
+            # the presenter may call show() right away, which needs
+            # to see the presentation
+            self._presentation = Future()
+            self._submit(target, self._presentation)
             self._run_blocking_event_loop()
 
     def open(self) -> None:
@@ -1122,6 +2049,7 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         if not self._opened and self._presentation is None:
             self._open()
             self._opened = True
+            self._last_shown = None
 
     def close(self) -> None:
         """Close this :py:class:`ImageDisplay`. This should also stop
@@ -1134,6 +2062,8 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         if self._opened:
             self._opened = False
             self._close()
+        self._last_shown = None
+        self._wake.set()
 
         presentation = self._presentation
         if presentation is not None:
@@ -1142,15 +2072,20 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
             # order for this to work smoothly, the presentation should
             # regularly check the display.closed property and exit
             # (before calling display.show) if that flag is True.
-            if presentation is not threading.current_thread():
-                presentation.join()
+            if self._presenter is not threading.current_thread():
+                self._wait(presentation)
                 self._presentation = None
+                self._presenter = None
 
-        event_loop = self._event_loop
-        if isinstance(event_loop, threading.Thread):
-            if event_loop is not threading.current_thread():
-                event_loop.join()
+        # only wait for event loops running in the background, submitted
+        # by this display: a blocking event loop runs in the thread that
+        # called show(), and that thread may be waiting for the caller
+        # of close().  It will end by itself once it notices the close.
+        if self._event_loop is threading.current_thread():
             self._event_loop = None
+        elif self._event_loop_future is not None:
+            self._wait(self._event_loop_future)
+            self._event_loop_future = None
 
     @property
     def opened(self) -> bool:
@@ -1190,6 +2125,12 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
 
     def _show(self, image: np.ndarray, wait_for_key: bool = False,
               timeout: float = None, **kwargs) -> None:
+        """Display the given image.  The `image` array is only valid
+        during this call: it may be the frame buffer of this display,
+        which is overwritten by the next call of :py:meth:`show`.
+        Implementations that keep the image beyond this call (e.g.,
+        for repainting the window later) have to copy it.
+        """
         raise NotImplementedError(f"{type(self).__name__} claims to "
                                   "be an ImageDisplay, but does not implement "
                                   "the _show method.")
@@ -1215,20 +2156,25 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
 
         start = time.time()
         try:
-            print("ImageDisplay: start dummy event loop. "
-                  f"closed={self.closed}")
+            LOG.info("ImageDisplay: start dummy event loop (closed=%s).",
+                     self.closed)
             while (not self.closed and
                    (timeout is None or time.time() < start + timeout)):
-                self._process_events()
-                time.sleep(interval)
+                self._process_frame_events()
+                # wait for the next poll, unless woken up earlier
+                if timeout is not None:
+                    interval = min(interval,
+                                   max(0., start + timeout - time.time()))
+                self._wake.wait(interval)
+                self._wake.clear()
         except BaseException as exception:
             LOG.error("Unhandled exception in event loop")
             handle_exception(exception)
         finally:
             LOG.info("ImageDisplay: ended dummy event loop (closed=%s).",
                      self.closed)
-            self._event_loop = None
             self.close()
+            self._event_loop = None
 
     def _run_blocking_event_loop(self, timeout: float = None) -> None:
         self._event_loop = threading.current_thread()
@@ -1249,17 +2195,63 @@ class ImageDisplay(ImageIO, Implementable, ImageGenerator.Observer):
         """
         if self.event_loop_is_running():
             raise RuntimeError("Only one event loop is allowed.")
-        self._event_loop = \
-            threading.Thread(target=self._nonblocking_event_loop)
-        self._event_loop.start()
+        self._event_loop_future = self._submit(self._nonblocking_event_loop)
 
     def _nonblocking_event_loop(self) -> None:
+        self._event_loop = threading.current_thread()
         self._dummy_event_loop()
 
     def event_loop_is_running(self) -> bool:
         """Check if an event loop is currently running.
         """
-        return self._event_loop is not None
+        return self._event_loop is not None or \
+            (self._event_loop_future is not None and
+             not self._event_loop_future.done())
+
+    @staticmethod
+    def _submit(function: Callable[[], None],
+                future: Optional[Future] = None) -> Future:
+        """Run a function in a dedicated background thread.  Event
+        loops and presentations run until the display is closed,
+        so they are not run in a thread pool of limited size (which
+        would block further displays once all threads are busy).
+
+        Arguments
+        ---------
+        function:
+            The function to run.
+        future:
+            A :py:class:`Future` to be used for the function.  This
+            allows to store the future before the function starts.
+            If `None`, a new :py:class:`Future` is created.
+
+        Result
+        ------
+        future:
+            A :py:class:`Future` that is done once the function
+            has finished.
+        """
+        if future is None:
+            future = Future()
+
+        def target() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                function()
+            except BaseException as exception:  # pylint: disable=broad-except
+                future.set_exception(exception)
+            else:
+                future.set_result(None)
+
+        threading.Thread(target=target, name='ImageDisplay',
+                         daemon=True).start()
+        return future
+
+    @staticmethod
+    def _wait(future: Future) -> None:
+        """Wait for a function started by :py:meth:`_submit`.
+        """
+        futures_wait((future,))
 
     # ------------------------------------------------------------------------
     # FIXME[old/todo]: currently used by ./contrib/styletransfer.py ...
@@ -1323,13 +2315,17 @@ class Location:
                                   f"does not provide a method for marking "
                                   f"an image.")
 
-    def extract_from_image(self, image: Imagelike) -> np.ndarray:
+    def extract_from_image(self, image: Imagelike,
+                           copy: bool = None) -> np.ndarray:
         """Extract this :py:class:`Location` from a given image.
 
         Arguments
         ---------
         image:
             The image from which the location is to be extracted.
+        copy:
+            A flag indicating if the result should be a copy (`True`)
+            or may be a view on the image (`False`).
         """
         raise NotImplementedError(f"Location {self.__class__.__name__} "
                                   f"does not provide a method for extraction "
@@ -1359,24 +2355,47 @@ class PointsBasedLocation:
     def __init__(self, points: np.ndarray) -> None:
         super().__init__()
         self._points = points
+        # _owns_points: a flag indicating that _points is an array
+        # allocated by this location (and not one provided by the
+        # caller), which may hence be modified in place
+        self._owns_points = False
+        # _bounds: the bounds (x_min, y_min, x_max, y_max) of the points,
+        # computed on demand and reset when the points are scaled
+        self._bounds: Optional[Tuple[float, float, float, float]] = None
+
+    def _get_bounds(self) -> Tuple[float, float, float, float]:
+        """The bounds `(x_min, y_min, x_max, y_max)` of the points.
+        """
+        if self._bounds is None:
+            self._bounds = tuple(self._points.min(axis=0).tolist() +
+                                 self._points.max(axis=0).tolist())
+        return self._bounds
 
     def __contains__(self, point) -> bool:
-        return ((self._points[:, 0].min() <= point[0] <=
-                 self._points[:, 0].max()) and
-                (self._points[:, 1].min() <= point[1] <=
-                 self._points[:, 1].max()))
+        x_min, y_min, x_max, y_max = self._get_bounds()
+        return x_min <= point[0] <= x_max and y_min <= point[1] <= y_max
 
     def __getitem__(self, idx):
         return self._points[idx]
 
     def mark_image(self, image: np.ndarray, color=(1, 0, 0)):
         """Mark this :py:class:`PointsBasedLocation` in an image.
+        Each point is marked by a 2x2 square, clipped at the image
+        borders.
         """
-        for point in self._points:
-            image[max(point[1]-1, 0):min(point[1]+1, image.shape[0]),
-                  max(point[0]-1, 0):min(point[0]+1, image.shape[1])] = color
-
-    def extract_from_image(self, image: Imagelike) -> np.ndarray:
+        points = np.asarray(self._points).astype(np.intp, copy=False)
+        # only points whose square intersects the image are marked
+        height, width = image.shape[:2]
+        points = points[(points[:, 0] >= 0) & (points[:, 0] <= width) &
+                        (points[:, 1] >= 0) & (points[:, 1] <= height)]
+        offsets = np.array((-1, 0))
+        rows = np.clip(points[:, 1, np.newaxis] + offsets, 0, height-1)
+        columns = np.clip(points[:, 0, np.newaxis] + offsets, 0, width-1)
+        # (n, 2, 1) and (n, 1, 2) broadcast to the (n, 2, 2) squares
+        image[rows[:, :, np.newaxis], columns[:, np.newaxis, :]] = color
+
+    def extract_from_image(self, image: Imagelike,
+                           copy: bool = None) -> np.ndarray:
         """Extract this :py:class:`Location` from a given image.
 
         Arguments
@@ -1384,15 +2403,18 @@ class PointsBasedLocation:
         image:
             The image from which this :py:class:`PointsBasedLocation`
             is to be extracted.
+        copy:
+            A flag indicating if the result should be a copy (`True`)
+            or may be a view on the image (`False`).
         """
         image = Image.as_array(image)
         height, width = image.shape[:2]
-        point1_x, point1_y = self._points.min(axis=0)
-        point2_x, point2_y = self._points.max(axis=0)
+        point1_x, point1_y, point2_x, point2_y = self._get_bounds()
         point1_x, point1_y = max(0, int(point1_x)), max(0, int(point1_y))
         point2_x, point2_y = \
             min(width, int(point2_x)), min(height, int(point2_y))
-        return image[point1_y:point2_y, point1_x:point2_x]
+        patch = image[point1_y:point2_y, point1_x:point2_x]
+        return patch.copy() if copy else patch
 
     def scale(self, factor: Union[float, Tuple[float, float]],
               reference: str = 'origin') -> None:
@@ -1405,15 +2427,33 @@ class PointsBasedLocation:
             of floats in which case the first number is the horizontal (x)
             scaling factor and the second numger is the vertical (y)
             scaling factor.
+        reference:
+            The fixed point of the scaling: either `'origin'`,
+            `'center'` (the mean of the points), or a point `(x, y)`.
+
+        The points are copied on the first scaling (integer points
+        are converted to float), so that an array provided by the
+        caller is never changed.  Later scalings operate in place.
         """
+        points = self._points
+        if not self._owns_points:
+            points = points.astype(np.float64 if points.dtype.kind != 'f'
+                                   else points.dtype)
+            self._owns_points = True
+
         if reference == 'origin':
-            reference = np.ndarray((0, 0))
-        elif reference == 'center':
-            reference = self._points.mean(axis=0)
+            np.multiply(points, factor, out=points)
         else:
-            reference = np.asarray(reference)
+            if reference == 'center':
+                reference = points.mean(axis=0)
+            else:
+                reference = np.asarray(reference, dtype=points.dtype)
+            np.subtract(points, reference, out=points)
+            np.multiply(points, factor, out=points)
+            np.add(points, reference, out=points)
 
-        self._points = (self._points - reference) * factor + reference
+        self._points = points
+        self._bounds = None
 
     @property
     def points(self) -> np.ndarray:
@@ -1441,11 +2481,16 @@ class Landmarks(PointsBasedLocation):
 class BoundingBox(PointsBasedLocation):
     # pylint: disable=invalid-name
     """A bounding box describes a rectangular arae in an image.
+
+    The coordinates are stored as four scalar attributes, the
+    `(2, 2)` array of points (upper left and lower right corner)
+    is only created on demand.
     """
 
     def __init__(self, x1=None, y1=None, x2=None, y2=None,
                  x=None, y=None, width=None, height=None) -> None:
-        super().__init__(np.ndarray((2, 2)))
+        self._x1, self._y1, self._x2, self._y2 = 0., 0., 0., 0.
+        super().__init__(None)
         if x1 is not None:
             self.x1 = x1
         elif x is not None:
@@ -1466,17 +2511,37 @@ class BoundingBox(PointsBasedLocation):
         elif height is not None:
             self.height = height
 
+    @property
+    def _points(self) -> np.ndarray:
+        """The corners of this :py:class:`BoundingBox` as an array
+        of shape `(2, 2)`.  The array is created on every access,
+        changing it will not change the :py:class:`BoundingBox`.
+        """
+        return np.array(((self._x1, self._y1), (self._x2, self._y2)))
+
+    @_points.setter
+    def _points(self, points: Optional[np.ndarray]) -> None:
+        if points is not None:
+            (self._x1, self._y1), (self._x2, self._y2) = points
+
+    def __contains__(self, point) -> bool:
+        return (self._x1 <= point[0] <= self._x2 and
+                self._y1 <= point[1] <= self._y2)
+
+    def __len__(self) -> int:
+        return 2
+
     @property
     def x1(self):
         """The horizontal position of the left border of this
         :py:class:`BoundingBox`.
 
         """
-        return self._points[0, 0]
+        return self._x1
 
     @x1.setter
     def x1(self, x1):
-        self._points[0, 0] = x1
+        self._x1 = x1
 
     @property
     def y1(self):
@@ -1484,11 +2549,11 @@ class BoundingBox(PointsBasedLocation):
         :py:class:`BoundingBox`.
 
         """
-        return self._points[0, 1]
+        return self._y1
 
     @y1.setter
     def y1(self, y1):
-        self._points[0, 1] = y1
+        self._y1 = y1
 
     @property
     def x2(self):
@@ -1496,11 +2561,11 @@ class BoundingBox(PointsBasedLocation):
         :py:class:`BoundingBox`.
 
         """
-        return self._points[1, 0]
+        return self._x2
 
     @x2.setter
     def x2(self, x2):
-        self._points[1, 0] = max(x2, self.x1)  # Avoid negative width
+        self._x2 = max(x2, self._x1)  # Avoid negative width
 
     @property
     def y2(self):
@@ -1508,11 +2573,11 @@ class BoundingBox(PointsBasedLocation):
         :py:class:`BoundingBox`.
 
         """
-        return self._points[1, 1]
+        return self._y2
 
     @y2.setter
     def y2(self, y2):
-        self._points[1, 1] = max(y2, self.y1)  # Avoid negative height
+        self._y2 = max(y2, self._y1)  # Avoid negative height
 
     @property
     def x(self):
@@ -1542,21 +2607,21 @@ class BoundingBox(PointsBasedLocation):
     def width(self):
         """The width of the :py:class:`BoundingBox`.
         """
-        return self.x2 - self.x1
+        return self._x2 - self._x1
 
     @width.setter
     def width(self, width):
-        self.x2 = self.x1 + width
+        self.x2 = self._x1 + width
 
     @property
     def height(self):
         """The height of the :py:class:`BoundingBox`.
         """
-        return self.y2 - self.y1
+        return self._y2 - self._y1
     
     @height.setter
     def height(self, height):
-        self.y2 = self.y1 + height
+        self.y2 = self._y1 + height
 
     @property
     def size(self) -> Size:
@@ -1570,78 +2635,136 @@ class BoundingBox(PointsBasedLocation):
         thickness = max(1, max(size)//300)
         t1 = thickness//2
         t2 = (thickness+1)//2
-        x1 = max(int(self.x1), t2)
-        y1 = max(int(self.y1), t2)
-        x2 = min(int(self.x2), size[0]-t1)
-        y2 = min(int(self.y2), size[1]-t1)
+        x1 = max(int(self._x1), t2)
+        y1 = max(int(self._y1), t2)
+        x2 = min(int(self._x2), size[0]-t1)
+        y2 = min(int(self._y2), size[1]-t1)
         # print(f"mark_image[{self}]: image size={size}"
         #       f"shape={image.shape}, {image.dtype}:"
         #       f"{image.min()}-{image.max()}, box:({x1}, {y1}) - ({x2}, {y2})")
-        for offset in range(-t2, t1):
-            image[(y1+offset, y2+offset), x1:x2] = color
-            image[y1:y2, (x1+offset, x2+offset)] = color
+        # each border is a band of `thickness` rows (or columns),
+        # ranging from offset -t2 to t1 around the border line
+        top = slice(max(y1-t2, 0), min(y1+t1, size[1]))
+        bottom = slice(max(y2-t2, 0), min(y2+t1, size[1]))
+        left = slice(max(x1-t2, 0), min(x1+t1, size[0]))
+        right = slice(max(x2-t2, 0), min(x2+t1, size[0]))
+        image[top, x1:x2] = color
+        image[bottom, x1:x2] = color
+        image[y1:y2, left] = color
+        image[y1:y2, right] = color
 
     def crop(self, image: Imagelike, size: Optional[Size] = None) -> Imagelike:
-        """Crop the bounding box from an image.
+        """Crop the bounding box from an image.  Parts of the bounding
+        box outside the image are padded with zeros.
 
         Arguments
         ---------
         size:
             The size of the resulting crop. If different from the size
-            of this :py:class:`BoundingBox`, the
+            of this :py:class:`BoundingBox`, the crop is resized to
+            that size.
+
+        Result
+        ------
+        crop:
+            The cropped image.  If the bounding box lies inside the
+            image and no resizing is required, this is a view on the
+            image, otherwise a new array.
         """
         image = Image.as_array(image)
-        if size is None:
-            size = self.size
-
-        img_width, img_height, img_channels = image.shape
-        result = np.ndarray((size.height, size.width, img_channels),
-                            image.dtype)
-        x1_source, x1_target = max(0, self.x1), max(-self.x1, 0)
-        y1_source, y1_target = max(0, self.y1), max(-self.y1, 0)
-        x2_source, x2_target = min(img_width, self.x2), \
-            min(size.width - (self.x2 - img_width), size.width)
-        y2_source, y2_target = min(img_height, self.y2), \
-            min(size.height - (self.y2 - img_height), size.height)
-        result[y1_target: y2_target, x1_target:x2_target] = \
-            image[y1_source: y2_source, x1_source:x2_source]
-
-        if size != self.size:
-            pass  # FIXME[todo]
+
+        img_height, img_width = image.shape[:2]
+        x1, y1 = int(self._x1), int(self._y1)
+        x2, y2 = int(self._x2), int(self._y2)
+        if 0 <= x1 and x2 <= img_width and 0 <= y1 and y2 <= img_height:
+            # box fully inside the image: take a view, no copy
+            result = image[y1:y2, x1:x2]
+        else:
+            # copy the part inside the image and pad the borders outside
+            # the image with zeros (only the borders are initialized)
+            result = np.empty((y2 - y1, x2 - x1) + image.shape[2:],
+                              image.dtype)
+            x1_source, y1_source = max(0, x1), max(0, y1)
+            x2_source, y2_source = min(img_width, x2), min(img_height, y2)
+            if x1_source < x2_source and y1_source < y2_source:
+                top, bottom = y1_source - y1, y2_source - y1
+                left, right = x1_source - x1, x2_source - x1
+                result[top:bottom, left:right] = \
+                    image[y1_source:y2_source, x1_source:x2_source]
+                result[:top].fill(0)
+                result[bottom:].fill(0)
+                result[top:bottom, :left].fill(0)
+                result[top:bottom, right:].fill(0)
+            else:
+                result.fill(0)
+
+        if size is not None and \
+                (int(size[0]), int(size[1])) != result.shape[1::-1]:
+            # pylint: disable=import-outside-toplevel
+            from ..util.image import imresize
+            result = imresize(result, (int(size[0]), int(size[1])))
 
         return result
 
     def extract_from_image(self, image: Imagelike, padding: bool = True,
                            copy: bool = None) -> np.ndarray:
         """Extract the region described by the bounding box from an image.
+
+        Arguments
+        ---------
+        image:
+            The image from which the region is to be extracted.
+        padding:
+            If `True`, parts of the bounding box outside of the image
+            are filled with zeros (this requires a copy).  If `False`
+            the bounding box is clipped to the image.
+        copy:
+            If `True`, the result is always a copy.  Otherwise the
+            result is a view on the image whenever possible (that is,
+            unless padding is required), which has to be copied by
+            the caller before the image is changed.
         """
         image = Image.as_array(image)
-        image_size = image.shape[1::-1]
+        image_height, image_width = image.shape[:2]
+        x1, x2 = int(self._x1), int(self._x2)
+        y1, y2 = int(self._y1), int(self._y2)
+        invalid = (x1 < 0 or x2 > image_width or
+                   y1 < 0 or y2 > image_height)
+        if not invalid and not copy:
+            return image[y1:y2, x1:x2]  # common case: a view on the image
+
+        # coordinates are clamped by conditional expressions, which are
+        # cheaper than calls of the builtin functions min() and max()
         channels = 1 if image.ndim < 3 else image.shape[2]
 
-        x1, x2 = int(self.x1), int(self.x2)
-        y1, y2 = int(self.y1), int(self.y2)
-        invalid = (x1 < 0 or x2 > image_size[0] or
-                   y1 < 0 or y2 > image_size[1])
-
         if invalid and padding:
             copy = True
         else:
             # no padding: resize bounding box to become valid
-            x1, x2 = max(x1, 0), min(x2, image_size[0])
-            y1, y2 = max(y1, 0), min(y2, image_size[1])
+            x1 = x1 if x1 > 0 else 0
+            x2 = x2 if x2 < image_width else image_width
+            y1 = y1 if y1 > 0 else 0
+            y2 = y2 if y2 < image_height else image_height
             invalid = False
         width, height = x2 - x1, y2 - y1
 
         if copy:
             shape = (height, width) + ((channels, ) if channels > 1 else ())
             box = np.zeros(shape, dtype=image.dtype)
-            slice_box0 = slice(max(-y1, 0), height-max(y2-image_size[1], 0))
-            slice_box1 = slice(max(-x1, 0), width-max(x2-image_size[0], 0))
-            slice_image0 = slice(max(y1, 0), min(y2, image_size[1]))
-            slice_image1 = slice(max(x1, 0), min(x2, image_size[0]))
-            LOG.debug("Extracting[%s]: image[%s, %s] -> box[%s, %s]", self,
-                      slice_image0, slice_image1, slice_box0, slice_box1)
+            slice_box0 = slice(-y1 if y1 < 0 else 0,
+                               height - (y2 - image_height
+                                         if y2 > image_height else 0))
+            slice_box1 = slice(-x1 if x1 < 0 else 0,
+                               width - (x2 - image_width
+                                        if x2 > image_width else 0))
+            slice_image0 = slice(y1 if y1 > 0 else 0,
+                                 y2 if y2 < image_height else image_height)
+            slice_image1 = slice(x1 if x1 > 0 else 0,
+                                 x2 if x2 < image_width else image_width)
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("Extracting[%s]: image[%s, %s] -> box[%s, %s]",
+                          self, slice_image0, slice_image1,
+                          slice_box0, slice_box1)
             box[slice_box0, slice_box1] = image[slice_image0, slice_image1]
         else:
             box = image[y1:y2, x1:x2]
@@ -1661,30 +2784,274 @@ class BoundingBox(PointsBasedLocation):
         """Adding two bounding boxes means to create a new bounding box
         that bounds both of them.
         """
-        return BoundingBox(x1=min(self.x1, other.x1),
-                           y1=min(self.y1, other.y1),
-                           x2=max(self.x2, other.x2),
-                           y2=max(self.y2, other.y2))
+        # pylint: disable=protected-access
+        return BoundingBox(x1=min(self._x1, other._x1),
+                           y1=min(self._y1, other._y1),
+                           x2=max(self._x2, other._x2),
+                           y2=max(self._y2, other._y2))
 
     def __mul__(self, other: 'BoundingBox') -> 'BoundingBox':
         """Multiplying two bounding boxes means to form the intersection.
 
         """
-        return BoundingBox(x1=max(self.x1, other.x1),
-                           y1=max(self.y1, other.y1),
-                           x2=min(self.x2, other.x2),
-                           y2=min(self.y2, other.y2))
+        # pylint: disable=protected-access
+        return BoundingBox(x1=max(self._x1, other._x1),
+                           y1=max(self._y1, other._y1),
+                           x2=min(self._x2, other._x2),
+                           y2=min(self._y2, other._y2))
 
     def area(self):
         """Compute the area of this :py:class:`BoundingBox`.
         """
-        return self.width * self.height
+        return (self._x2 - self._x1) * (self._y2 - self._y1)
 
     @property
     def center(self) -> Tuple[float, float]:
         """The center of this bounding box as an (x,y) pair.
         """
-        return ((self.x1 + self.x2)/2, (self.y1 + self.y2)/2)
+        return ((self._x1 + self._x2)/2, (self._y1 + self._y2)/2)
+
+
+def union_boxes(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Compute the bounding boxes bounding pairs of boxes.
+
+    Arguments
+    ---------
+    boxes_a, boxes_b:
+        Arrays of shape `(N, 4)`, holding boxes as `(x1, y1, x2, y2)`.
+
+    Result
+    ------
+    union:
+        An array of shape `(N, 4)`, with `union[n]` being the smallest
+        box containing `boxes_a[n]` and `boxes_b[n]`.
+    """
+    boxes_a, boxes_b = np.asarray(boxes_a), np.asarray(boxes_b)
+    union = np.empty(np.broadcast_shapes(boxes_a.shape, boxes_b.shape),
+                     dtype=np.result_type(boxes_a, boxes_b))
+    np.minimum(boxes_a[..., :2], boxes_b[..., :2], out=union[..., :2])
+    np.maximum(boxes_a[..., 2:], boxes_b[..., 2:], out=union[..., 2:])
+    return union
+
+
+def intersect_boxes(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Compute the intersections of pairs of boxes.
+
+    Arguments
+    ---------
+    boxes_a, boxes_b:
+        Arrays of shape `(N, 4)`, holding boxes as `(x1, y1, x2, y2)`.
+
+    Result
+    ------
+    intersection:
+        An array of shape `(N, 4)`, with `intersection[n]` being the
+        intersection of `boxes_a[n]` and `boxes_b[n]`.  Disjoint boxes
+        result in empty boxes, that is `x2 < x1` or `y2 < y1`.
+    """
+    boxes_a, boxes_b = np.asarray(boxes_a), np.asarray(boxes_b)
+    intersection = np.empty(np.broadcast_shapes(boxes_a.shape, boxes_b.shape),
+                            dtype=np.result_type(boxes_a, boxes_b))
+    np.maximum(boxes_a[..., :2], boxes_b[..., :2], out=intersection[..., :2])
+    np.minimum(boxes_a[..., 2:], boxes_b[..., 2:], out=intersection[..., 2:])
+    return intersection
+
+
+def iou_matrix(boxes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Compute the pairwise intersection over union (IoU) of two sets
+    of boxes.
+
+    If Numba is available, a compiled kernel is used, otherwise
+    the computation is done by numpy broadcasting, which creates
+    intermediate arrays of shape `(N, K)`.
+
+    Arguments
+    ---------
+    boxes:
+        An array of shape `(N, 4)`, holding boxes as `(x1, y1, x2, y2)`.
+    query:
+        An array of shape `(K, 4)`, holding boxes as `(x1, y1, x2, y2)`.
+
+    Result
+    ------
+    iou:
+        A `float64` array of shape `(N, K)`, with `iou[n, k]` being
+        the IoU of `boxes[n]` and `query[k]`.  Disjoint boxes have
+        an IoU of `0`.
+    """
+    boxes = np.ascontiguousarray(boxes, dtype=np.float64).reshape(-1, 4)
+    query = np.ascontiguousarray(query, dtype=np.float64).reshape(-1, 4)
+    if importlib.util.find_spec('numba') is not None:
+        # pylint: disable=import-outside-toplevel
+        from ..thirdparty.numba import iou_matrix as iou_matrix_kernel
+        iou = np.empty((len(boxes), len(query)))
+        iou_matrix_kernel(boxes, query, iou)
+        return iou
+
+    intersection = intersect_boxes(boxes[:, np.newaxis], query[np.newaxis])
+    widths = np.maximum(intersection[..., 2] - intersection[..., 0], 0.)
+    heights = np.maximum(intersection[..., 3] - intersection[..., 1], 0.)
+    intersection_areas = widths * heights
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    query_areas = (query[:, 2] - query[:, 0]) * (query[:, 3] - query[:, 1])
+    unions = areas[:, np.newaxis] + query_areas - intersection_areas
+    return np.divide(intersection_areas, unions,
+                     out=np.zeros_like(intersection_areas),
+                     where=intersection_areas > 0)
+
+
+class BoundingBoxArray:
+    """An array of :py:class:`BoundingBox`es, stored as one array of
+    shape `(N, 4)`, holding the coordinates `(x1, y1, x2, y2)` of one
+    box per row.  Operations are applied to all boxes at once, instead
+    of looping over individual :py:class:`BoundingBox` objects.
+    """
+
+    def __init__(self, xyxy: np.ndarray) -> None:
+        self.xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self.xyxy)
+
+    def __getitem__(self, idx: int) -> BoundingBox:
+        x1, y1, x2, y2 = self.xyxy[idx].tolist()
+        return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+
+    @classmethod
+    def from_list(cls, boxes: Iterable[BoundingBox]) -> 'BoundingBoxArray':
+        """Create a :py:class:`BoundingBoxArray` from a list of
+        :py:class:`BoundingBox`es.
+        """
+        return cls(np.array([(box.x1, box.y1, box.x2, box.y2)
+                             for box in boxes], dtype=np.float64))
+
+    def to_list(self) -> List[BoundingBox]:
+        """Get the boxes of this :py:class:`BoundingBoxArray` as a list
+        of :py:class:`BoundingBox`es.
+        """
+        return [BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+                for x1, y1, x2, y2 in self.xyxy.tolist()]
+
+    @property
+    def widths(self) -> np.ndarray:
+        """The widths of the boxes."""
+        return self.xyxy[:, 2] - self.xyxy[:, 0]
+
+    @property
+    def heights(self) -> np.ndarray:
+        """The heights of the boxes."""
+        return self.xyxy[:, 3] - self.xyxy[:, 1]
+
+    def __add__(self, other: 'BoundingBoxArray') -> 'BoundingBoxArray':
+        """Adding two :py:class:`BoundingBoxArray`s means to create
+        the boxes bounding each pair of boxes (see
+        :py:meth:`BoundingBox.__add__`).
+        """
+        return BoundingBoxArray(union_boxes(self.xyxy, other.xyxy))
+
+    def __mul__(self, other: 'BoundingBoxArray') -> 'BoundingBoxArray':
+        """Multiplying two :py:class:`BoundingBoxArray`s means to form
+        the intersection of each pair of boxes (see
+        :py:meth:`BoundingBox.__mul__`).
+        """
+        return BoundingBoxArray(intersect_boxes(self.xyxy, other.xyxy))
+
+    def union(self) -> BoundingBox:
+        """The :py:class:`BoundingBox` bounding all boxes of this
+        :py:class:`BoundingBoxArray` (the sum of all boxes).
+        """
+        if not len(self.xyxy):
+            raise ValueError("Cannot form the union of no boxes.")
+        x1, y1 = self.xyxy[:, :2].min(axis=0).tolist()
+        x2, y2 = self.xyxy[:, 2:].max(axis=0).tolist()
+        return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+
+    def intersection(self) -> BoundingBox:
+        """The intersection of all boxes of this
+        :py:class:`BoundingBoxArray` (the product of all boxes).
+        """
+        if not len(self.xyxy):
+            raise ValueError("Cannot form the intersection of no boxes.")
+        x1, y1 = self.xyxy[:, :2].max(axis=0).tolist()
+        x2, y2 = self.xyxy[:, 2:].min(axis=0).tolist()
+        return BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2)
+
+    def iou(self, other: 'BoundingBoxArray') -> np.ndarray:
+        """The pairwise intersection over union of the boxes of this
+        and another :py:class:`BoundingBoxArray` (see
+        :py:func:`iou_matrix`).
+        """
+        return iou_matrix(self.xyxy, other.xyxy)
+
+    def scale(self, factor: Union[float, Tuple[float, float]],
+              reference: str = 'origin') -> None:
+        """Scale all boxes (see :py:meth:`PointsBasedLocation.scale`).
+
+        Arguments
+        ---------
+        factor:
+            The scaling factor, either a float or a pair of floats
+            (horizontal and vertical factor).
+        reference:
+            Either `'origin'`, `'center'` (scale each box around its
+            own center), or a point `(x, y)`.
+        """
+        corners = self.xyxy.reshape(-1, 2, 2)
+        if reference == 'origin':
+            reference = np.zeros(2)
+        elif reference == 'center':
+            reference = corners.mean(axis=1, keepdims=True)
+        else:
+            reference = np.asarray(reference)
+        self.xyxy = \
+            ((corners - reference) * factor + reference).reshape(-1, 4)
+
+    def clip_to_image(self, image: Imagelike) -> None:
+        """Clip all boxes to the area of an image.
+
+        Arguments
+        ---------
+        image:
+            The image (or an image array), providing the area.
+        """
+        height, width = Image.as_array(image).shape[:2]
+        np.clip(self.xyxy, 0, (width, height, width, height), out=self.xyxy)
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Check which points are contained in which box.
+
+        Arguments
+        ---------
+        points:
+            An array of shape `(M, 2)` providing `M` points as
+            `(x, y)` coordinates.
+
+        Result
+        ------
+        contained:
+            A boolean array of shape `(N, M)`, with `contained[n, m]`
+            indicating if point `m` lies in box `n`.
+        """
+        points_x, points_y = np.asarray(points).T[:, np.newaxis, :]
+        xyxy = self.xyxy[:, :, np.newaxis]
+        return ((xyxy[:, 0] <= points_x) & (points_x <= xyxy[:, 2]) &
+                (xyxy[:, 1] <= points_y) & (points_y <= xyxy[:, 3]))
+
+    def extract_from_image(self, image: Imagelike) -> List[np.ndarray]:
+        """Extract the regions described by the boxes from an image.
+        The boxes are clipped to the image and the regions are
+        returned as views on the image.
+        """
+        image = Image.as_array(image)
+        height, width = image.shape[:2]
+        bounds = np.clip(self.xyxy.astype(np.intp), 0,
+                         (width, height, width, height))
+        return [image[y1:y2, x1:x2] for x1, y1, x2, y2 in bounds.tolist()]
+
+
+# _MISSING: marker for missing values (allowing to store None as value)
+_MISSING = object()
+
 
 class Region:
     """A region in an image, optionally annotated with attributes.
@@ -1697,15 +3064,24 @@ class Region:
 
     _attributes: dict
         A dictionary with further attributes describing the region,
-        e.g., a label.
+        e.g., a label.  These can be accessed as attributes of
+        the region.
     """
+    # '__dict__' allows to set further (ad hoc) attributes, as done by
+    # some GUI code - the dictionary is only allocated on first use
+    __slots__ = ('_location', '_attributes', '__dict__')
 
     _location: Location
-    _atributes = None
+    _attributes: Dict[str, Any]
 
     color_min_confidence: np.ndarray = np.asarray((255., 0., 0.))  # red
     color_max_confidence: np.ndarray = np.asarray((0., 255., 0.))  # green
 
+    # _confidence_colors: a lookup table, mapping 256 confidence levels
+    # to marking colors, computed on first use for each class (see
+    # :py:meth:`_confidence_color`)
+    _confidence_colors: Optional[List[Tuple[int, ...]]] = None
+
     def __init__(self, location: Location, **attributes):
         self._location = location
         self._attributes = attributes
@@ -1717,10 +3093,15 @@ class Region:
         return point in self._location
 
     def __getattr__(self, name: str) -> Any:
-        if name in self._attributes:
-            return self._attributes[name]
+        try:
+            attributes = object.__getattribute__(self, '_attributes')
+        except AttributeError:  # not yet initialized (e.g. unpickling)
+            raise AttributeError(name) from None
+        value = attributes.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         raise AttributeError(f"Region has no attribute '{name}'. Valid "
-                             f"attributes are: {self._attributes.keys()}")
+                             f"attributes are: {attributes.keys()}")
 
     def __len__(self) -> int:
         return len(self._attributes)
@@ -1745,13 +3126,29 @@ class Region:
         # be modified in place (e.g. filename/URL) -> should we rather
         # return the marked image?
         if color is None and 'confidence' in self._attributes:
-            confidence = max(0, min(1.0, self._attributes['confidence']))
-            mark_color = ((1-confidence) * self.color_min_confidence +
-                          confidence * self.color_max_confidence)
-            color = tuple(mark_color.astype(np.uint8))
+            color = self._confidence_color(self._attributes['confidence'])
         image = Image.as_array(image)
         self._location.mark_image(image, color=color)
 
+    def _confidence_color(self, confidence: float) -> Tuple[int, ...]:
+        """The color for marking a region with a given confidence,
+        interpolated between :py:attr:`color_min_confidence` and
+        :py:attr:`color_max_confidence`.
+        """
+        cls = type(self)
+        colors = cls.__dict__.get('_confidence_colors')
+        if colors is None:
+            levels = np.linspace(0., 1., 256)[:, np.newaxis]
+            colors = ((1-levels) * cls.color_min_confidence +
+                      levels * cls.color_max_confidence)
+            colors = [tuple(color) for color in
+                      colors.astype(np.uint8).tolist()]
+            cls._confidence_colors = colors
+        # clamp to the table, mapping an undefined (NaN) confidence to 0
+        index = (int(confidence * 255) if 0 < confidence < 1 else
+                 255 if confidence >= 1 else 0)
+        return colors[index]
+
     def extract_from_image(self, image: Imagelike, **kwargs) -> np.ndarray:
         """Extract this :py:class:`Region` from a given image.
 
@@ -1788,4 +3185,140 @@ class Region:
             point.
         """
         if self._location is not None:
-            self._location.scale(factor)
+            self._location.scale(factor, reference=reference)
+
+    @classmethod
+    def scale_batch(cls, regions: Iterable['Region'],
+                    factor: Union[float, Tuple[float, float]],
+                    reference: str = 'origin') -> None:
+        """Scale multiple regions by a given factor (see
+        :py:meth:`scale`).  Regions located by a :py:class:`BoundingBox`
+        are scaled together by a single operation on a
+        :py:class:`BoundingBoxArray`, other regions are scaled
+        individually.
+        """
+        # pylint: disable=protected-access
+        boxes = []
+        for region in regions:
+            if isinstance(region._location, BoundingBox):
+                boxes.append(region._location)
+            elif region._location is not None:
+                region._location.scale(factor, reference=reference)
+        if not boxes:
+            return
+        array = BoundingBoxArray.from_list(boxes)
+        array.scale(factor, reference=reference)
+        for box, (x1, y1, x2, y2) in zip(boxes, array.xyxy.tolist()):
+            box._x1, box._y1, box._x2, box._y2 = x1, y1, x2, y2
+
+
+class RegionIndex:
+    """A static spatial index over a collection of :py:class:`Region`s,
+    allowing to find the regions at a point (or overlapping a box)
+    without checking every region.
+
+    The index is a packed R-tree, built by Sort-Tile-Recursive (STR)
+    packing: the bounding boxes of the regions are sorted into
+    vertical slices by their horizontal centers and within each slice
+    by their vertical centers, and then grouped into nodes of
+    `fanout` consecutive boxes.  Each level of the tree is stored as
+    one array of node bounds, so that a query tests all candidate
+    nodes of a level by a single vectorized operation.
+
+    The index is static: changing the regions after building the
+    index will not update it.
+
+    Arguments
+    ---------
+    regions:
+        The regions to index.  Regions located by a
+        :py:class:`BoundingBox` or another
+        :py:class:`PointsBasedLocation` are indexed by their bounds,
+        regions without such a location will never be found.
+    fanout:
+        The maximal number of children of a node in the tree.
+    """
+
+    def __init__(self, regions: Iterable[Region], fanout: int = 32) -> None:
+        self._regions = list(regions)
+        self._fanout = fanout
+
+        bounds = np.full((len(self._regions), 4), (np.inf, np.inf,
+                                                   -np.inf, -np.inf))
+        for index, region in enumerate(self._regions):
+            location = region.location
+            if isinstance(location, BoundingBox):
+                bounds[index] = (location.x1, location.y1,
+                                 location.x2, location.y2)
+            elif isinstance(location, PointsBasedLocation):
+                # pylint: disable=protected-access
+                bounds[index] = location._get_bounds()
+
+        # Sort-Tile-Recursive ordering of the boxes
+        leaves = -(-len(bounds) // fanout)
+        slice_size = fanout * max(1, int(np.ceil(np.sqrt(leaves))))
+        with np.errstate(invalid='ignore'):  # unindexed regions: nan
+            centers = (bounds[:, :2] + bounds[:, 2:]) / 2
+        order = np.argsort(centers[:, 0], kind='stable')
+        for start in range(0, len(order), slice_size):
+            tile = order[start:start+slice_size]
+            order[start:start+slice_size] = \
+                tile[np.argsort(centers[tile, 1], kind='stable')]
+        self._order = order
+
+        # _levels: the bounds of the nodes of each level of the tree,
+        # starting with the (sorted) boxes of the regions, up to the
+        # root node
+        self._levels = [bounds[order]]
+        while len(self._levels[-1]) > 1:
+            level = self._levels[-1]
+            padding = -len(level) % fanout
+            if padding:
+                level = np.concatenate((level, np.full((padding, 4), (
+                    np.inf, np.inf, -np.inf, -np.inf))))
+            nodes = level.reshape(-1, fanout, 4)
+            self._levels.append(np.concatenate(
+                (nodes[:, :, :2].min(axis=1), nodes[:, :, 2:].max(axis=1)),
+                axis=1))
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def query(self, location: Union[Tuple[float, float], BoundingBox]
+              ) -> List[Region]:
+        """Find the regions at a point or overlapping a box.
+
+        Arguments
+        ---------
+        location:
+            Either a point `(x, y)` or a :py:class:`BoundingBox`.
+
+        Result
+        ------
+        regions:
+            The regions containing the point, or whose bounds overlap
+            the box.
+        """
+        if isinstance(location, BoundingBox):
+            query = (location.x1, location.y1, location.x2, location.y2)
+        else:
+            query = (location[0], location[1], location[0], location[1])
+
+        if not self._regions:
+            return []
+        # walk down the tree, keeping the nodes overlapping the query
+        candidates = np.zeros(1, dtype=np.intp)
+        for depth in range(len(self._levels) - 1, -1, -1):
+            bounds = self._levels[depth][candidates]
+            hits = ((bounds[:, 0] <= query[2]) & (query[0] <= bounds[:, 2]) &
+                    (bounds[:, 1] <= query[3]) & (query[1] <= bounds[:, 3]))
+            candidates = candidates[hits]
+            if depth > 0:
+                children = (candidates[:, np.newaxis] * self._fanout +
+                            np.arange(self._fanout)).ravel()
+                candidates = children[children < len(self._levels[depth-1])]
+        regions = [self._regions[index]
+                   for index in self._order[candidates].tolist()]
+        if not isinstance(location, BoundingBox):
+            regions = [region for region in regions if location in region]
+        return regions
@@ -102,6 +102,12 @@ class Implementable:
     _implementation_register: Dict[str, Tuple[List, List]] = {}
     _module_aliases: Dict[str, str] = {}
 
+    # _resolved_implementations: a cache mapping the arguments of
+    # :py:meth:`get_implementation` to the implementation obtained.
+    # The cache is invalidated whenever a new implementation or
+    # module alias is registered.
+    _resolved_implementations: Dict[tuple, 'Implementation'] = {}
+
     _implementations: List[Implementation]
     _implementation_candidates: List[str]
 
@@ -119,6 +125,8 @@ class Implementable:
             The actual implementation or the fully qualified name of the
             class implementing `cls`.
         """
+        Implementable._resolved_implementations.clear()
+
         # obtain the implementation and candidate registers for the
         # implementable
         implementations, candidates = \
@@ -186,6 +194,7 @@ class Implementable:
         """
         Implementable._module_aliases[alias] = \
             module.__name__ if isinstance(module, ModuleType) else module
+        Implementable._resolved_implementations.clear()
 
     @staticmethod
     def registered_implementables() -> Iterable[str]:
@@ -448,6 +457,26 @@ class Implementable:
         NotImplementedError:
             No implementation could be obtained.
         """
+        key = (cls, module if isinstance(module, (str, ModuleType)) or
+               module is None else tuple(module), implementation)
+        try:
+            return Implementable._resolved_implementations[key]
+        except KeyError:
+            pass  # not resolved yet
+        except TypeError:
+            return cls._get_implementation(module, implementation)
+
+        new_cls = cls._get_implementation(module, implementation)
+        Implementable._resolved_implementations[key] = new_cls
+        return new_cls
+
+    @classmethod
+    def _get_implementation(cls, module: Optional[Moduleslike],
+                            implementation: Optional[Implementationlike]
+                            ) -> Implementation:
+        """Actual implementation of :py:meth:`get_implementation`,
+        without caching.
+        """
         # Obtain module_names from the 'module' parameter
         if module is None:
             module_names = None
@@ -3,12 +3,26 @@
 
 # standard imports
 import unittest
+import unittest.mock
 import importlib
 import os
+import pickle
+import threading
+import time
+import tempfile
+
+# third party imports
+import numpy as np
 
 # toolbox imports
 from dltb.typing import get_origin, get_args
-from dltb.base.image import Size, Sizelike, Image
+from dltb.base.image import Size, Sizelike, Image, ImageReader, ImageResizer
+from dltb.base.image import MemmapImageCache, ImageBatch, ImageOperator
+from dltb.base.image import ImageAdapter, register_url_reader, Colorspace
+from dltb.base.image import Landmarks, BoundingBox, BoundingBoxArray
+from dltb.base.image import union_boxes, intersect_boxes, iou_matrix
+from dltb.base.image import Region, RegionIndex
+from dltb.base.image import ImageDisplay
 
 
 class TestSize(unittest.TestCase):
@@ -168,3 +182,849 @@ class TestImage(unittest.TestCase):
         image = Image(self.example_image_filename)
         pil = Image.as_pil(image)
         self.assertIsInstance(pil, module.PIL.Image.Image)
+
+    def test_image_passthrough(self):
+        """Test that an :py:class:`Image` is reused unless copied.
+        """
+        array = np.zeros((4, 6, 3), dtype=np.uint8)
+        image = Image(array)
+        self.assertIs(Image(image), image)
+        self.assertIs(image.array, array)
+        copied = Image(image, copy=True)
+        self.assertIsNot(copied, image)
+        self.assertFalse(np.shares_memory(copied.array, array))
+
+    def test_visualize(self):
+        """Test arranging a batch of images as gallery.
+        """
+        images = np.random.randint(0, 255, (5, 4, 6, 3), dtype=np.uint8)
+        gallery = Image(array=images, batch=True).visualize()
+        self.assertEqual(gallery.shape, (8, 18, 3))
+        self.assertTrue(np.array_equal(gallery[4:, 6:12], images[4]))
+        self.assertTrue((gallery[4:, 12:] == 0).all())
+
+    def test_as_array_copy(self):
+        """Test that :py:meth:`Image.as_array` only copies on demand.
+        """
+        array = np.zeros((4, 6, 3), dtype=np.uint8)
+        self.assertIs(Image.as_array(array), array)
+        self.assertIsNot(Image.as_array(array, copy=True), array)
+        converted = Image.as_array(array, copy=True, dtype=np.float32)
+        self.assertFalse(np.shares_memory(converted, array))
+
+        view = array[:, ::2]
+        result = Image.as_array(view, contiguous=True)
+        self.assertTrue(result.flags.c_contiguous)
+        self.assertTrue(np.array_equal(result, view))
+
+    @unittest.skipIf(not os.path.isfile('assets/logo.png'),
+                     reason="Example image is not available")
+    def test_as_array_file(self):
+        """Test that reading an image from file provides a fresh array.
+        """
+        first = Image.as_array('assets/logo.png')
+        second = Image.as_array('assets/logo.png', copy=True)
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertTrue(np.array_equal(first, second))
+
+    def test_as_array_rgb(self):
+        """Test expanding a grayscale image to RGB.
+        """
+        gray = np.arange(6, dtype=np.uint8).reshape(2, 3)
+        rgb = Image.as_array(gray, colorspace=Colorspace.RGB,
+                             readonly=True)
+        self.assertEqual(rgb.shape, (2, 3, 3))
+        self.assertTrue(np.shares_memory(rgb, gray))
+        self.assertTrue((rgb[..., 2] == gray).all())
+
+        rgb = Image.as_array(gray, colorspace=Colorspace.RGB)
+        self.assertTrue(rgb.flags.writeable)
+        self.assertFalse(np.shares_memory(rgb, gray))
+        rgb[0, 0] = 7
+        self.assertEqual(gray[0, 0], 0)
+
+    def test_as_array_colorspace(self):
+        """Test conversion to BGR and HSV colorspace.
+        """
+        rgb = np.array([[[255, 0, 0], [0, 128, 0], [0, 0, 0]]],
+                       dtype=np.uint8)
+        bgr = Image.as_array(rgb, colorspace=Colorspace.BGR)
+        self.assertTrue(np.array_equal(bgr, rgb[..., ::-1]))
+
+        hsv = Image.as_array(rgb, colorspace=Colorspace.HSV)
+        self.assertEqual(hsv.dtype, np.float32)
+        self.assertTrue(np.allclose(hsv, [[[0, 1, 1], [120, 1, 128/255],
+                                           [0, 0, 0]]]))
+
+    def test_url_reader(self):
+        """Test reading images by a registered URL reader.
+        """
+        register_url_reader('test', lambda url: np.full((2, 2), len(url)))
+        array = Image.as_array('test://image')
+        self.assertEqual(array.shape, (2, 2))
+        self.assertEqual(array[0, 0], len('test://image'))
+
+    def test_as_normalized(self):
+        """Test normalization of an image.
+        """
+        image = np.random.randint(0, 255, (4, 6, 3), dtype=np.uint8)
+        mean, std = (10., 20., 30.), (2., 4., 8.)
+        normalized = Image.as_normalized(image, mean, std)
+        self.assertEqual(normalized.dtype, np.float32)
+        self.assertTrue(np.allclose(normalized, (image - mean) / std))
+
+        out = np.empty(image.shape, dtype=np.float64)
+        self.assertIs(Image.as_normalized(image, 127.5, 127.5, out=out), out)
+        self.assertTrue(np.allclose(out, image / 127.5 - 1.))
+
+        image16 = np.array([[0, 1000, 65535]], dtype=np.uint16)
+        normalized = Image.as_normalized(image16, 1000., 2.)
+        self.assertEqual(normalized.dtype, np.float32)
+        self.assertTrue(np.allclose(normalized, (image16 - 1000.) / 2.))
+
+    def test_as_nchw(self):
+        """Test conversion between channel last and channel first layout.
+        """
+        batch = np.random.randint(0, 255, (2, 4, 6, 3), dtype=np.uint8)
+        nchw = Image.as_nchw(batch)
+        self.assertEqual(nchw.shape, (2, 3, 4, 6))
+        self.assertTrue(nchw.flags.c_contiguous)
+        self.assertTrue(np.array_equal(Image.as_nhwc(nchw), batch))
+
+        out = np.empty((3, 4, 6), dtype=np.uint8)
+        self.assertIs(Image.as_nchw(batch[0], out=out), out)
+        self.assertTrue(np.array_equal(out[1], batch[0, :, :, 1]))
+        with self.assertRaises(ValueError):
+            Image.as_nchw(batch, out=out)
+
+
+class TestImageDisplay(unittest.TestCase):
+    """Tests for the :py:class:`ImageDisplay` interface.
+    """
+
+    class Display(ImageDisplay):
+        """A display recording the shown images.
+        """
+
+        def __init__(self, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self.shown = []
+            self.processed = 0
+
+        def _open(self) -> None:
+            pass
+
+        def _show(self, image: np.ndarray, **_kwargs) -> None:
+            self.shown.append(image)
+
+        def _close(self) -> None:
+            pass
+
+        def _process_events(self) -> None:
+            self.processed += 1
+
+    def test_show_frame_buffer(self):
+        """Test conversion of frames into the reused frame buffer.
+        """
+        display = self.Display(blocking=None)
+        display.show(np.full((4, 5, 3), 3.0, dtype=np.float32))
+        display.show(np.full((4, 5, 3), 7.0, dtype=np.float32))
+        self.assertIs(display.shown[0], display.shown[1])
+        self.assertEqual(display.shown[1].dtype, np.uint8)
+        self.assertTrue((display.shown[1] == 7).all())
+
+        frame = np.zeros((4, 5, 3), dtype=np.uint8)
+        display.show(frame)
+        self.assertIs(display.shown[2], frame)
+        display.close()
+
+    def test_show_file(self):
+        """Test showing an image file multiple times.
+        """
+        # pylint: disable=import-outside-toplevel
+        from dltb.util.image import imwrite
+        display = self.Display(blocking=None)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'image.png')
+            imwrite(filename, np.full((4, 5, 3), 9, dtype=np.uint8))
+            display.show(filename)
+            display.show(filename)
+        self.assertIs(display.shown[0], display.shown[1])
+        self.assertTrue((display.shown[1] == 9).all())
+        self.assertFalse(display.shown[1].flags.writeable)
+        # a missing file is reported by the image reader
+        with unittest.mock.patch.object(Image, 'as_array',
+                                        side_effect=ValueError('reader')):
+            with self.assertRaisesRegex(ValueError, 'reader'):
+                display.show(os.path.join(directory, 'missing.png'))
+        display.close()
+
+    def test_show_version(self):
+        """Test skipping repeated display of an unchanged image.
+        """
+        display = self.Display(blocking=None)
+        frame = np.zeros((4, 5, 3), dtype=np.uint8)
+        display.show(frame, version=1)
+        display.show(frame, version=1)
+        self.assertEqual(len(display.shown), 1)
+        display.show(frame, version=2)
+        display.show(frame)
+        display.show(frame)
+        self.assertEqual(len(display.shown), 4)
+        # a differently strided view of the same memory is a new frame
+        square = np.zeros((4, 4), dtype=np.uint8)
+        display.show(square, version=3)
+        display.show(square.T, version=3)
+        self.assertEqual(len(display.shown), 6)
+        display.close()
+
+    def test_close_event_loop(self):
+        """Test that closing the display from another thread ends a
+        blocking event loop, and that closing ends a background loop.
+        """
+        display = self.Display(blocking=True)
+        frame = np.zeros((4, 5, 3), dtype=np.uint8)
+        timer = threading.Timer(0.05, display.close)
+        start = time.time()
+        timer.start()
+        display.show(frame, timeout=10.)
+        timer.join()
+        self.assertLess(time.time() - start, 5.)
+        self.assertTrue(display.closed)
+
+        display = self.Display(blocking=False)
+        display.show(frame)
+        self.assertTrue(display.event_loop_is_running())
+        display.close()
+        self.assertFalse(display.event_loop_is_running())
+
+    def test_present(self):
+        """Test running a presentation in the background.
+        """
+        def presenter(display, frames):
+            for frame in frames:
+                if display.closed:
+                    break
+                display.show(frame)
+
+        display = self.Display()
+        frames = [np.full((4, 5, 3), i, dtype=np.uint8) for i in range(3)]
+        display.present(presenter, (frames,))
+        self.assertTrue(display.closed)
+        self.assertFalse(display.event_loop_is_running())
+        self.assertEqual(len(display.shown), 3)
+
+    def test_many_displays(self):
+        """Test that background event loops of many non-blocking
+        displays and a presentation all run at the same time.
+        """
+        frame = np.zeros((4, 5, 3), dtype=np.uint8)
+        displays = [self.Display(blocking=False) for _ in range(6)]
+        try:
+            for display in displays:
+                display.show(frame)
+            deadline = time.time() + 5.
+            while (time.time() < deadline and
+                   not all(display.processed for display in displays)):
+                time.sleep(0.01)
+            for display in displays:
+                self.assertGreater(display.processed, 0)
+
+            presented = []
+            self.Display().present(lambda display: presented.append(1))
+            self.assertEqual(presented, [1])
+        finally:
+            for display in displays:
+                display.close()
+
+
+class TestLandmarks(unittest.TestCase):
+    """Tests for the :py:class:`Landmarks` class.
+    """
+
+    def test_mark_image(self):
+        """Test marking landmarks, including points at the border.
+        """
+        image = np.zeros((10, 12, 3), dtype=np.uint8)
+        landmarks = Landmarks(np.array([[5, 4], [0, 0], [12, 10]]))
+        landmarks.mark_image(image, color=(255, 0, 0))
+        marked = image[..., 0] == 255
+        self.assertTrue(marked[3:5, 4:6].all())
+        self.assertTrue(marked[0, 0] and marked[9, 11])
+        self.assertEqual(marked.sum(), 4 + 1 + 1)
+        self.assertTrue((image[..., 1:] == 0).all())
+
+        # points whose square lies outside of the image are not marked
+        image[:] = 0
+        Landmarks(np.array([[30, 40], [-1, 5], [5, -2]])).mark_image(image)
+        self.assertFalse(image.any())
+
+    def test_contains(self):
+        """Test checking if a point lies in the bounds of the landmarks.
+        """
+        landmarks = Landmarks(np.array([[2, 3], [6, 8], [4, 1]]))
+        self.assertIn((2, 1), landmarks)
+        self.assertNotIn((7, 4), landmarks)
+        landmarks.scale(2)
+        self.assertIn((7, 4), landmarks)
+
+    def test_scale(self):
+        """Test scaling landmarks.
+        """
+        landmarks = Landmarks(np.array([[2, 3], [6, 8]]))
+        landmarks.scale(2)
+        self.assertTrue(np.array_equal(landmarks.points, [[4, 6], [12, 16]]))
+        landmarks.scale((.5, 1), reference='center')
+        self.assertTrue(np.array_equal(landmarks.points, [[6, 6], [10, 16]]))
+        landmarks.scale(2, reference=(6, 6))
+        self.assertTrue(np.array_equal(landmarks.points, [[6, 6], [14, 26]]))
+
+        # a float array provided by the caller is not changed
+        points = np.array([[2., 3.], [6., 8.]])
+        landmarks = Landmarks(points)
+        landmarks.scale(2)
+        self.assertTrue(np.array_equal(points, [[2, 3], [6, 8]]))
+        self.assertTrue(np.array_equal(landmarks.points, [[4, 6], [12, 16]]))
+
+    def test_extract_from_image(self):
+        """Test extracting the bounding region of landmarks.
+        """
+        image = np.arange(10*12, dtype=np.uint8).reshape((10, 12))
+        landmarks = Landmarks(np.array([[2, 3], [6, 8]]))
+        patch = landmarks.extract_from_image(image)
+        self.assertTrue(np.array_equal(patch, image[3:8, 2:6]))
+        self.assertTrue(np.shares_memory(patch, image))
+        patch = landmarks.extract_from_image(image, copy=True)
+        self.assertFalse(np.shares_memory(patch, image))
+
+
+class TestBoundingBox(unittest.TestCase):
+    """Tests for the :py:class:`BoundingBox` class.
+    """
+
+    def test_mark_image(self):
+        """Test drawing the border of a bounding box.
+        """
+        image = np.zeros((20, 30, 3), dtype=np.uint8)
+        BoundingBox(x1=5, y1=4, x2=15, y2=12).mark_image(image)
+        marked = image[..., 1] == 255
+        self.assertTrue(marked[3, 5:15].all() and marked[11, 5:15].all())
+        self.assertTrue(marked[4:12, 4].all() and marked[4:12, 14].all())
+        self.assertFalse(marked[5:11, 5:14].any())
+        # the lower right corner is shared by bottom and right border
+        self.assertEqual(marked.sum(), 2*10 + 2*8 - 1)
+
+        image = np.zeros((600, 900, 3), dtype=np.uint8)
+        BoundingBox(x1=100, y1=100, x2=200, y2=300).mark_image(image)
+        marked = image[..., 1] == 255
+        self.assertTrue(marked[98:101, 100:200].all())
+        self.assertFalse(marked[97, 100:200].any() or
+                         marked[101, 101:198].any())
+
+    def test_extract_from_image(self):
+        """Test extracting a bounding box with and without padding.
+        """
+        image = np.arange(20*30, dtype=np.uint16).reshape((20, 30))
+        box = BoundingBox(x1=25, y1=-3, x2=40, y2=5)
+        patch = box.extract_from_image(image)
+        self.assertEqual(patch.shape, (8, 15))
+        self.assertTrue(np.array_equal(patch[3:, :5], image[:5, 25:]))
+        self.assertFalse(patch[:3].any() or patch[:, 5:].any())
+        patch = box.extract_from_image(image, padding=False)
+        self.assertTrue(np.array_equal(patch, image[:5, 25:]))
+        self.assertTrue(np.shares_memory(patch, image))
+
+        box = BoundingBox(x1=2, y1=3, x2=12, y2=8)
+        patch = box.extract_from_image(image)
+        self.assertTrue(np.array_equal(patch, image[3:8, 2:12]))
+        self.assertTrue(np.shares_memory(patch, image))
+        patch = box.extract_from_image(image, copy=True)
+        self.assertTrue(np.array_equal(patch, image[3:8, 2:12]))
+        self.assertFalse(np.shares_memory(patch, image))
+
+    def test_coordinates(self):
+        """Test the coordinates and the points of a bounding box.
+        """
+        box = BoundingBox(x=2, y=3, width=4, height=5)
+        self.assertEqual((box.x1, box.y1, box.x2, box.y2), (2, 3, 6, 8))
+        self.assertEqual(box.size, (4, 5))
+        self.assertTrue(np.array_equal(box.points, [[2, 3], [6, 8]]))
+        self.assertIn((4, 4), box)
+        self.assertNotIn((7, 4), box)
+        box.height = -1
+        self.assertEqual(box.y2, box.y1)
+        box.scale(2, reference='center')
+        self.assertEqual((box.x1, box.y1, box.x2, box.y2), (0, 3, 8, 3))
+
+    def test_crop(self):
+        """Test cropping inside and across the image border.
+        """
+        image = np.arange(20*30*3, dtype=np.uint16).reshape((20, 30, 3))
+        crop = BoundingBox(x1=5, y1=4, x2=15, y2=12).crop(image)
+        self.assertEqual(crop.shape, (8, 10, 3))
+        self.assertTrue(np.shares_memory(crop, image))
+        self.assertTrue(np.array_equal(crop, image[4:12, 5:15]))
+
+        crop = BoundingBox(x1=-2, y1=16, x2=8, y2=24).crop(image)
+        self.assertEqual(crop.shape, (8, 10, 3))
+        self.assertFalse(np.shares_memory(crop, image))
+        self.assertTrue(np.array_equal(crop[:4, 2:], image[16:, :8]))
+        self.assertTrue((crop[4:] == 0).all() and (crop[:, :2] == 0).all())
+
+        crop = BoundingBox(x1=25, y1=-3, x2=40, y2=5).crop(image)
+        self.assertEqual(crop.shape, (8, 15, 3))
+        self.assertTrue(np.array_equal(crop[3:, :5], image[:5, 25:]))
+        self.assertTrue((crop[:3] == 0).all() and (crop[:, 5:] == 0).all())
+
+        crop = BoundingBox(x1=50, y1=30, x2=52, y2=33).crop(image)
+        self.assertEqual(crop.shape, (3, 2, 3))
+        self.assertFalse(crop.any())
+
+        # a crop of a different size is resized
+        crop = BoundingBox(x1=5, y1=4, x2=15, y2=12).crop(image, size=(5, 4))
+        self.assertEqual(crop.shape, (4, 5, 3))
+        crop = BoundingBox(x1=-2, y1=16, x2=8, y2=24).crop(image,
+                                                           size=(20, 16))
+        self.assertEqual(crop.shape, (16, 20, 3))
+
+
+class TestBoundingBoxArray(unittest.TestCase):
+    """Tests for the :py:class:`BoundingBoxArray` class.
+    """
+
+    def setUp(self):
+        self._boxes = [BoundingBox(x1=1, y1=2, x2=5, y2=6),
+                       BoundingBox(x1=-2, y1=4, x2=8, y2=30)]
+        self._array = BoundingBoxArray.from_list(self._boxes)
+
+    def test_list(self):
+        """Test conversion from and to lists of boxes.
+        """
+        self.assertEqual(len(self._array), 2)
+        self.assertEqual(self._array.xyxy.shape, (2, 4))
+        boxes = self._array.to_list()
+        self.assertEqual(boxes[1].y2, 30)
+        self.assertEqual(self._array[0].size, self._boxes[0].size)
+
+    def test_scale(self):
+        """Test scaling all boxes.
+        """
+        self._array.scale(2)
+        self.assertTrue(np.array_equal(self._array.xyxy[0], [2, 4, 10, 12]))
+        self._array.scale(.5, reference='center')
+        self.assertTrue(np.array_equal(self._array.xyxy[0], [4, 6, 8, 10]))
+
+        array = BoundingBoxArray.from_list(self._boxes)
+        array.scale((2, 3), reference='center')
+        for box in self._boxes:
+            box.scale((2, 3), reference='center')
+        self.assertTrue(np.array_equal(
+            array.xyxy, BoundingBoxArray.from_list(self._boxes).xyxy))
+
+    def test_contains(self):
+        """Test checking if points are contained in the boxes.
+        """
+        points = np.array([[3, 3], [0, 10], [9, 9]])
+        self.assertTrue(np.array_equal(self._array.contains(points),
+                                       [[True, False, False],
+                                        [False, True, False]]))
+        self.assertEqual([tuple(p) in self._boxes[1] for p in points],
+                         [False, True, False])
+
+    def test_extract_from_image(self):
+        """Test clipping boxes and extracting regions.
+        """
+        image = np.zeros((20, 10, 3), dtype=np.uint8)
+        patches = self._array.extract_from_image(image)
+        self.assertEqual([patch.shape for patch in patches],
+                         [(4, 4, 3), (16, 8, 3)])
+        self._array.clip_to_image(image)
+        self.assertTrue(np.array_equal(self._array.xyxy[1], [0, 4, 8, 20]))
+
+    def test_union_intersection(self):
+        """Test union and intersection of boxes, compared to the
+        corresponding operations on individual boxes.
+        """
+        other = [BoundingBox(x1=3, y1=0, x2=4, y2=9),
+                 BoundingBox(x1=0, y1=0, x2=9, y2=9)]
+        others = BoundingBoxArray.from_list(other)
+        union = self._array + others
+        intersection = self._array * others
+        for index, (box, other_box) in enumerate(zip(self._boxes, other)):
+            box_union, box_intersection = box + other_box, box * other_box
+            self.assertEqual(tuple(union.xyxy[index]),
+                             (box_union.x1, box_union.y1,
+                              box_union.x2, box_union.y2))
+            self.assertEqual(tuple(intersection.xyxy[index]),
+                             (box_intersection.x1, box_intersection.y1,
+                              box_intersection.x2, box_intersection.y2))
+        self.assertTrue(np.array_equal(
+            union_boxes(self._array.xyxy, others.xyxy[:1]),
+            [[1, 0, 5, 9], [-2, 0, 8, 30]]))
+        self.assertTrue(np.array_equal(
+            intersect_boxes(self._array.xyxy, others.xyxy[:1]),
+            [[3, 2, 4, 6], [3, 4, 4, 9]]))
+
+    def test_reduce(self):
+        """Test union and intersection of all boxes of an array.
+        """
+        union = self._array.union()
+        intersection = self._array.intersection()
+        box_union = self._boxes[0] + self._boxes[1]
+        box_intersection = self._boxes[0] * self._boxes[1]
+        self.assertEqual((union.x1, union.y1, union.x2, union.y2),
+                         (box_union.x1, box_union.y1,
+                          box_union.x2, box_union.y2))
+        self.assertEqual((intersection.x1, intersection.y1,
+                          intersection.x2, intersection.y2),
+                         (box_intersection.x1, box_intersection.y1,
+                          box_intersection.x2, box_intersection.y2))
+        with self.assertRaises(ValueError):
+            BoundingBoxArray(np.empty((0, 4))).union()
+
+    def test_iou(self):
+        """Test the pairwise intersection over union, both with and
+        without the compiled kernel.
+        """
+        query = np.array([[1, 2, 5, 6], [3, 4, 7, 8], [10, 0, 12, 1]])
+        expected = [[1., 4/28, 0.], [8/268, 16/260, 0.]]
+        self.assertTrue(np.allclose(self._array.iou(
+            BoundingBoxArray(query)), expected))
+        with unittest.mock.patch('importlib.util.find_spec',
+                                 return_value=None):
+            self.assertTrue(np.allclose(iou_matrix(self._array.xyxy, query),
+                                        expected))
+
+
+class TestRegion(unittest.TestCase):
+    """Tests for the :py:class:`Region` class.
+    """
+
+    def test_confidence_color(self):
+        """Test marking regions with colors according to confidence.
+        """
+        image = np.zeros((10, 10, 3), dtype=np.uint8)
+        box = BoundingBox(x1=2, y1=2, x2=6, y2=6)
+        Region(box, confidence=1.5).mark_image(image)
+        self.assertEqual(tuple(image[1, 3]), (0, 255, 0))
+        Region(box, confidence=0.).mark_image(image)
+        self.assertEqual(tuple(image[1, 3]), (255, 0, 0))
+        Region(box, confidence=1.).mark_image(image)
+        Region(box, confidence=float('nan')).mark_image(image)
+        self.assertEqual(tuple(image[1, 3]), (255, 0, 0))
+        Region(box, confidence=.5).mark_image(image)
+        self.assertTrue(np.allclose(image[1, 3], (127, 127, 0), atol=1))
+
+        class BlueRegion(Region):
+            """A region using blue for high confidence."""
+            __slots__ = ()
+            color_max_confidence = np.asarray((0., 0., 255.))
+
+        BlueRegion(box, confidence=1.).mark_image(image)
+        self.assertEqual(tuple(image[1, 3]), (0, 0, 255))
+        Region(box, confidence=1.).mark_image(image)
+        self.assertEqual(tuple(image[1, 3]), (0, 255, 0))
+
+    def test_scale_batch(self):
+        """Test scaling multiple regions at once.
+        """
+        boxes = [BoundingBox(x1=2, y1=2, x2=6, y2=6),
+                 BoundingBox(x1=0, y1=4, x2=2, y2=8)]
+        landmarks = Landmarks(np.array([[2., 2.], [4., 6.]]))
+        regions = [Region(box) for box in boxes] + [Region(landmarks)]
+        Region.scale_batch(regions, (2, 3), reference='center')
+        self.assertEqual((boxes[0].x1, boxes[0].y1, boxes[0].x2,
+                          boxes[0].y2), (0, -2, 8, 10))
+        self.assertEqual((boxes[1].x1, boxes[1].y2), (-1, 12))
+        self.assertTrue(np.array_equal(landmarks.points,
+                                       [[1., -2.], [5., 10.]]))
+
+    def test_attributes(self):
+        """Test accessing, setting, and pickling region attributes.
+        """
+        region = Region(BoundingBox(x1=2, y1=2, x2=6, y2=6), label=3)
+        region.invalid = True
+        self.assertEqual((region.label, region.invalid, len(region)),
+                         (3, True, 1))
+        self.assertFalse(getattr(region, 'valid', False))
+        copy = pickle.loads(pickle.dumps(region))
+        self.assertEqual((copy.label, copy.invalid), (3, True))
+        self.assertEqual(copy.location.x2, 6)
+
+
+class TestRegionIndex(unittest.TestCase):
+    """Tests for the :py:class:`RegionIndex` class.
+    """
+
+    def setUp(self):
+        points = np.random.default_rng(0).uniform(0, 100, size=(200, 2))
+        self._regions = [Region(BoundingBox(x1=x, y1=y, x2=x+10, y2=y+5),
+                                index=index)
+                         for index, (x, y) in enumerate(points.tolist())]
+        self._regions.append(Region(Landmarks(np.array([[0., 0.],
+                                                        [3., 3.]])),
+                                    index=-1))
+        self._index = RegionIndex(self._regions, fanout=4)
+
+    def test_query_point(self):
+        """Test finding the regions containing a point.
+        """
+        for point in ((50., 50.), (2., 2.), (-1., 0.), (105., 50.)):
+            found = sorted(region.index
+                           for region in self._index.query(point))
+            expected = [region.index for region in self._regions
+                        if point in region]
+            self.assertEqual(found, sorted(expected))
+
+    def test_query_box(self):
+        """Test finding the regions overlapping a box.
+        """
+        box = BoundingBox(x1=20, y1=30, x2=40, y2=35)
+        found = sorted(region.index for region in self._index.query(box))
+        expected = [region.index for region in self._regions[:-1]
+                    if (region.location.x1 <= box.x2 and
+                        box.x1 <= region.location.x2 and
+                        region.location.y1 <= box.y2 and
+                        box.y1 <= region.location.y2)]
+        self.assertEqual(found, sorted(expected))
+        self.assertEqual(RegionIndex([]).query(box), [])
+
+
+class TestImageAdapter(unittest.TestCase):
+    """Test the :py:class:`ImageAdapter` interface.
+    """
+
+    class Adapter(ImageAdapter):
+        """A minimal :py:class:`ImageAdapter`.
+        """
+
+        def _image_to_internal(self, image):
+            return Image.as_array(image)
+
+        def internal_to_image(self, data):
+            return data
+
+    def test_image_to_internal(self):
+        """Test that the internal representation keeps `uint8`.
+        """
+        images = [np.zeros((4, 5, 3), dtype=np.uint8)] * 2
+        internal = self.Adapter().image_to_internal(images)
+        self.assertEqual(internal.shape, (2, 4, 5, 3))
+        self.assertEqual(internal.dtype, ImageAdapter.dtype)
+
+    def test_image_to_internal_batch(self):
+        """Test processing a batch with a single call.
+        """
+        class BatchAdapter(self.Adapter):
+            """An adapter processing full batches.
+            """
+            batch_supported = True
+
+            def _image_to_internal(self, image):
+                return image[..., ::-1]
+
+        images = [np.zeros((4, 5, 3), dtype=np.uint8)] * 3
+        internal = BatchAdapter().image_to_internal(images)
+        self.assertEqual(internal.shape, (3, 4, 5, 3))
+
+    def test_image_to_internal_reuse(self):
+        """Test reusing the internal batch buffer.
+        """
+        adapter = self.Adapter()
+        adapter.internal_shape = (4, 5, 3)
+        adapter.reuse_internal_buffer = True
+        images = [np.zeros((4, 5, 3), dtype=np.uint8)] * 3
+        first = adapter.image_to_internal(images)
+        second = adapter.image_to_internal(images[:2])
+        self.assertEqual(second.shape, (2, 4, 5, 3))
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_device_normalize(self):
+        """Test normalization of `uint8` data.
+        """
+        data = np.array([[[0, 51, 255]]], dtype=np.uint8)
+        normalized = self.Adapter().device_normalize(data, mean=.2, std=.5)
+        self.assertTrue(np.allclose(normalized, (data/255 - .2) / .5))
+
+        adapter = self.Adapter()
+        adapter.normalized_dtype = np.float16
+        normalized = adapter.device_normalize(data, mean=.2, std=.5)
+        self.assertEqual(normalized.dtype, np.float16)
+
+
+class TestImageBatch(unittest.TestCase):
+    """Test the :py:class:`ImageBatch` class.
+    """
+
+    def test_from_images(self):
+        """Test creating an :py:class:`ImageBatch` from images of
+        different size.
+        """
+        images = [np.ones((4, 6, 3), dtype=np.uint8),
+                  np.full((2, 3, 3), 2, dtype=np.uint8)]
+        batch = ImageBatch.from_images(images)
+        self.assertEqual(batch.arrays.shape, (2, 4, 6, 3))
+        self.assertEqual(len(batch), 2)
+        self.assertFalse(batch.uniform)
+        self.assertEqual(batch[1].shape, (2, 3, 3))
+        self.assertTrue((batch[1] == 2).all())
+        self.assertTrue((batch.arrays[1, 2:] == 0).all())
+
+    def test_call_batch(self):
+        """Test applying an :py:class:`ImageOperator` to a batch.
+        """
+        class Invert(ImageOperator):
+            # pylint: disable=too-few-public-methods
+            __slots__ = ()
+
+            def __call__(self, image: np.ndarray) -> np.ndarray:
+                return 255 - image
+
+        batch = ImageBatch.from_images([np.zeros((2, 2), dtype=np.uint8)])
+        result = Invert().call_batch(batch)
+        self.assertTrue(result.uniform)
+        self.assertTrue((result.arrays == 255).all())
+
+
+class TestImageOperator(unittest.TestCase):
+    """Test the :py:class:`ImageOperator` interface.
+    """
+
+    class Invert(ImageOperator):
+        """An operator provided as universal function.
+        """
+        __slots__ = ()
+
+        def as_ufunc(self):
+            return np.invert
+
+    def test_call(self):
+        """Test calling an operator provided as universal function.
+        """
+        image = np.zeros((2, 3), dtype=np.uint8)
+        self.assertTrue((self.Invert()(image) == 255).all())
+        self.assertTrue((image == 0).all())
+
+    def test_apply_inplace(self):
+        """Test in place application of an operator.
+        """
+        image = np.zeros((2, 3), dtype=np.uint8)
+        result = ImageOperator._apply_inplace(image,
+                                              self.Invert().as_ufunc())
+        self.assertIs(result, image)
+        self.assertTrue((image == 255).all())
+        with self.assertRaises(NotImplementedError):
+            ImageOperator()(image)
+        with self.assertRaises(TypeError):
+            ImageOperator._apply_inplace(image, lambda image, out: out)
+
+    def test_transform(self):
+        """Test transforming an image file by a universal function.
+        """
+        # pylint: disable=import-outside-toplevel
+        from dltb.util.image import imread, imwrite
+        image = np.zeros((4, 5, 3), dtype=np.uint8)
+        image[1:3] = 200
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source.png')
+            target = os.path.join(directory, 'target.png')
+            imwrite(source, image)
+            with unittest.mock.patch.object(
+                    ImageOperator, '_apply_inplace',
+                    wraps=ImageOperator._apply_inplace) as apply_inplace:
+                self.Invert().transform(source, target)
+            apply_inplace.assert_called_once()
+            self.assertTrue(np.array_equal(imread(target), 255 - image))
+
+
+class TestImageReader(unittest.TestCase):
+    """Test the :py:class:`ImageReader` interface.
+    """
+
+    class DummyReader:
+        # pylint: disable=too-few-public-methods
+        """A stand-in reader providing images filled with the length of
+        the filename.  This is not derived from :py:class:`ImageReader`
+        to avoid registering it as an implementation.
+        """
+
+        read_batch = ImageReader.read_batch
+        prefetch_next = ImageReader.prefetch_next
+
+        def read(self, filename: str, **_kwargs) -> np.ndarray:
+            """Provide a dummy image.
+            """
+            return np.full((2, 3, 3), len(filename), dtype=np.uint8)
+
+    def test_read_batch(self):
+        """Test reading a batch of images into a preallocated array.
+        """
+        reader = self.DummyReader()
+        batch = reader.read_batch(['a', 'bb', 'ccc'])
+        self.assertEqual(batch.shape, (3, 2, 3, 3))
+        self.assertTrue(batch.flags.c_contiguous)
+        self.assertEqual(batch[2, 0, 0, 0], 3)
+
+        out = np.zeros((2, 2, 3, 3), dtype=np.float32)
+        self.assertIs(reader.read_batch(['a', 'bb'], out=out), out)
+        self.assertEqual(out[1, 1, 1, 1], 2.)
+
+    def test_prefetch_next(self):
+        """Test reading images in the background.
+        """
+        futures = self.DummyReader().prefetch_next(['a', 'bb'])
+        self.assertEqual(len(futures), 2)
+        self.assertEqual(futures[1].result()[0, 0, 0], 2)
+
+    def test_memmap_cache(self):
+        """Test reading images through a :py:class:`MemmapImageCache`.
+        """
+        reader = self.DummyReader()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'cache.npy')
+            cache = MemmapImageCache(filename, shape=(2, 3, 3), capacity=4)
+            batch = reader.read_batch(['a', 'bb', 'a'], cache=cache)
+            self.assertEqual(len(cache), 2)
+            self.assertIn('bb', cache)
+            self.assertEqual(batch[1, 0, 0, 0], 2)
+            cache.flush()
+            del cache
+
+            cache = MemmapImageCache(filename, shape=(2, 3, 3), capacity=4)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.get_or_decode('bb', reader=None)[0, 0, 0],
+                             2)
+
+
+class TestImageResizer(unittest.TestCase):
+    """Test the :py:class:`ImageResizer` interface.
+    """
+
+    def test_crop(self):
+        """Test center cropping of single images and batches.
+        """
+        image = np.arange(6*8).reshape(6, 8)
+        crop = ImageResizer.crop(image, (2, 4))
+        self.assertEqual(crop.shape, (2, 4))
+        self.assertEqual(crop[0, 0], image[2, 2])
+        self.assertTrue(np.shares_memory(crop, image))
+
+        # the offset is shape//2 - size//2, for odd and even differences
+        # pylint: disable=protected-access
+        for shape, size, offset in (((6, 8), (3, 5), (2, 2)),
+                                    ((4, 6), (3, 4), (1, 1)),
+                                    ((5, 7), (2, 4), (1, 1)),
+                                    ((5, 7), (3, 3), (1, 2))):
+            window = ImageResizer._center_window(shape, size)
+            self.assertEqual((window[0].start, window[1].start), offset)
+            self.assertEqual((window[0].stop - window[0].start,
+                              window[1].stop - window[1].start), size)
+
+        # sizes exceeding the shape yield the full axis
+        self.assertEqual(ImageResizer.crop(image, (10, 4)).shape, (6, 4))
+
+        batch = np.zeros((5, 6, 8, 3))
+        self.assertEqual(ImageResizer.crop(batch, (2, 4)).shape, (5, 2, 4, 3))
+
+        cropper = ImageResizer.center_cropper(image.shape, (2, 4))
+        self.assertTrue(np.array_equal(cropper(image), crop))
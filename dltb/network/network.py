@@ -1185,7 +1185,7 @@ class Network(NetworkBase, Extendable, Preparable, method='network_changed',
             terminal.output(f"({index:3}) {line}")
 
 
-class ImageNetwork(ImageExtension, ImageTool, base=Network):
+class ImageNetwork(ImageExtension, Network, ImageTool, base=Network):
     """A network for image processiong. Such a network provides
     additional methods to support passing images as arguments.
 
@@ -94,6 +94,10 @@ Implementable.register_implementation(_DLTB + '.base.image.ImageResizer',
 Implementable.register_implementation(_DLTB + '.base.image.ImageWarper',
                                       _THIRDPARTY + '.skimage.ImageUtils')
 
+Implementable.register_module_alias(_THIRDPARTY + '.numba', 'numba')
+Implementable.register_implementation(_DLTB + '.base.image.ImageResizer',
+                                      _THIRDPARTY + '.numba.image.ImageUtils')
+
 Implementable.register_module_alias(_THIRDPARTY + '.qt', 'qt')
 Implementable.register_implementation(_DLTB + '.base.image.ImageDisplay',
                                       _THIRDPARTY + '.qt.ImageDisplay')
@@ -185,6 +189,13 @@ _MODULES = {
             'ImageResizer': 'ImageUtils'
         }
     },
+    'numba': {
+        'modules': ['numba', 'numpy'],
+        # the ImageResizer is in the submodule 'numba.image' and has
+        # to be requested explicitly
+        'classes': {
+        }
+    },
     'sklearn': {
         'modules': ['sklearn'],
         'classes': {
@@ -0,0 +1,182 @@
+"""Interface to the Numba just-in-time compiler.  This module provides
+compiled kernels for basic image operations.  An :py:class:`ImageResizer`
+based on these kernels is provided by the submodule
+:py:mod:`dltb.thirdparty.numba.image`.  The kernels are kept separate,
+so that using them does not load that resizer (loaded implementations
+are preferred when instantiating an :py:class:`ImageResizer`).
+
+The kernels operate on preallocated output arrays, so that the caller
+can reuse buffers across invocations.
+"""
+
+# standard imports
+import logging
+
+# third party imports
+import numpy as np
+import numba
+
+# logging
+LOG = logging.getLogger(__name__)
+
+
+@numba.njit(parallel=True, cache=True)
+def resize_nearest(source: np.ndarray, out: np.ndarray) -> None:
+    """Resize an image using nearest neighbour interpolation.
+
+    Arguments
+    ---------
+    source:
+        The image to be resized, of shape `(H, W)` or `(H, W, C)`.
+    out:
+        The output array, of shape `(H', W')` or `(H', W', C)`.
+    """
+    height, width = out.shape[0], out.shape[1]
+    rows, columns = source.shape[0], source.shape[1]
+    for row in numba.prange(height):  # pylint: disable=not-an-iterable
+        source_row = (row * rows) // height
+        for column in range(width):
+            out[row, column] = source[source_row, (column * columns) // width]
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def normalize(source: np.ndarray, mean: np.ndarray, inverse_std: np.ndarray,
+              out: np.ndarray) -> None:
+    """Normalize an image of shape `(H, W, C)` by subtracting a
+    per channel `mean` and multiplying with the per channel
+    `inverse_std` (that is `1/std`).  The result is stored in `out`,
+    which may have a different dtype than `source` (usually
+    `np.float32`).
+    """
+    height, width, channels = source.shape
+    for row in numba.prange(height):  # pylint: disable=not-an-iterable
+        for column in range(width):
+            for channel in range(channels):
+                out[row, column, channel] = \
+                    ((source[row, column, channel] - mean[channel]) *
+                     inverse_std[channel])
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def rgb_to_hsv(source: np.ndarray, scale: float, out: np.ndarray) -> None:
+    """Convert an RGB image of shape `(H, W, 3)` into HSV colorspace.
+    Pixel values are multiplied by `scale` to obtain the range 0-1
+    (use `1/255` for `uint8` images).  The result (hue in degrees,
+    saturation and value in the range 0-1) is stored in `out`.
+    """
+    height, width = source.shape[0], source.shape[1]
+    for row in numba.prange(height):  # pylint: disable=not-an-iterable
+        for column in range(width):
+            red = source[row, column, 0] * scale
+            green = source[row, column, 1] * scale
+            blue = source[row, column, 2] * scale
+            cmax = max(red, green, blue)
+            delta = cmax - min(red, green, blue)
+            if delta == 0:
+                hue = 0.
+            elif cmax == red:
+                hue = 60. * (((green - blue) / delta) % 6.)
+            elif cmax == green:
+                hue = 60. * ((blue - red) / delta + 2.)
+            else:
+                hue = 60. * ((red - green) / delta + 4.)
+            out[row, column, 0] = hue
+            out[row, column, 1] = delta / cmax if cmax > 0 else 0.
+            out[row, column, 2] = cmax
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def tile_into(images: np.ndarray, out: np.ndarray,
+              height: int, width: int, columns: int) -> None:
+    """Arrange a batch of images as tiles in a grid, resizing each
+    image to the tile size using bilinear interpolation.
+
+    Arguments
+    ---------
+    images:
+        The batch of images, of shape `(N, H, W, C)`.  Images with
+        a single channel are replicated to all channels of `out`.
+    out:
+        The output array, of shape `(rows*height, columns*width, C')`.
+    height, width:
+        The size of a tile.
+    columns:
+        The number of tiles per row.
+    """
+    count, rows_in, columns_in, channels = images.shape
+    scale_y = rows_in / height
+    scale_x = columns_in / width
+    for index in numba.prange(count):  # pylint: disable=not-an-iterable
+        top = (index // columns) * height
+        left = (index % columns) * width
+        for row in range(height):
+            source_y = min(max((row + .5) * scale_y - .5, 0.), rows_in - 1)
+            y_0 = int(source_y)
+            y_1 = min(y_0 + 1, rows_in - 1)
+            f_y = source_y - y_0
+            for column in range(width):
+                source_x = min(max((column + .5) * scale_x - .5, 0.),
+                               columns_in - 1)
+                x_0 = int(source_x)
+                x_1 = min(x_0 + 1, columns_in - 1)
+                f_x = source_x - x_0
+                for channel in range(out.shape[2]):
+                    source_c = channel if channels > 1 else 0
+                    out[top + row, left + column, channel] = \
+                        ((1 - f_y) * ((1 - f_x) *
+                                      images[index, y_0, x_0, source_c] +
+                                      f_x * images[index, y_0, x_1, source_c])
+                         + f_y * ((1 - f_x) *
+                                  images[index, y_1, x_0, source_c] +
+                                  f_x * images[index, y_1, x_1, source_c]))
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def iou_matrix(boxes: np.ndarray, query: np.ndarray, out: np.ndarray) -> None:
+    """Compute the intersection over union (IoU) of each box in
+    `boxes` (shape `(N, 4)`) with each box in `query` (shape `(K, 4)`),
+    both given as `(x1, y1, x2, y2)`.  The result is stored in `out`,
+    of shape `(N, K)`.
+    """
+    count, queries = boxes.shape[0], query.shape[0]
+    query_areas = np.empty(queries, dtype=out.dtype)
+    for index in range(queries):
+        query_areas[index] = ((query[index, 2] - query[index, 0]) *
+                              (query[index, 3] - query[index, 1]))
+    for row in numba.prange(count):  # pylint: disable=not-an-iterable
+        area = ((boxes[row, 2] - boxes[row, 0]) *
+                (boxes[row, 3] - boxes[row, 1]))
+        for column in range(queries):
+            width = (min(boxes[row, 2], query[column, 2]) -
+                     max(boxes[row, 0], query[column, 0]))
+            height = (min(boxes[row, 3], query[column, 3]) -
+                      max(boxes[row, 1], query[column, 1]))
+            if width <= 0 or height <= 0:
+                out[row, column] = 0.
+            else:
+                intersection = width * height
+                out[row, column] = \
+                    intersection / (area + query_areas[column] - intersection)
+
+
+@numba.njit(parallel=True, cache=True)
+def statistics(values: np.ndarray) -> tuple:
+    """Compute minimum, maximum, mean, and variance of a non-empty
+    one-dimensional floating point array `values`.  Minimum and
+    maximum are taken in the first pass, together with the sum,
+    and the variance is computed in a second pass as the mean
+    squared deviation from the mean (which, unlike the sum of
+    squares, does not suffer from cancellation).
+    """
+    minimum, maximum = values[0], values[0]
+    total = 0.
+    for index in numba.prange(values.size):  # pylint: disable=not-an-iterable
+        minimum = min(minimum, values[index])
+        maximum = max(maximum, values[index])
+        total += values[index]
+    mean = total / values.size
+    deviation = 0.
+    for index in numba.prange(values.size):  # pylint: disable=not-an-iterable
+        difference = values[index] - mean
+        deviation += difference * difference
+    return minimum, maximum, mean, deviation / values.size
@@ -0,0 +1,73 @@
+"""An :py:class:`ImageResizer` based on the compiled Numba kernels
+from :py:mod:`dltb.thirdparty.numba`.
+"""
+
+# standard imports
+from typing import Callable, Tuple
+import logging
+
+# third party imports
+import numpy as np
+import numba
+
+# toolbox imports
+from ...base import image
+from ...base.image import Size, Sizelike
+from . import resize_nearest, normalize
+
+# logging
+LOG = logging.getLogger(__name__)
+
+
+class ImageUtils(image.ImageResizer):
+    """An :py:class:`ImageResizer` using compiled Numba kernels.
+    Resizing is done by nearest neighbour interpolation, which is
+    fast but does not smooth the image.
+    """
+
+    @classmethod
+    def configure(cls, num_threads: int = 1) -> None:
+        """Configure the number of threads used by the parallel Numba
+        kernels.  The value can not exceed the number of threads
+        available to Numba (`numba.config.NUMBA_NUM_THREADS`).
+        """
+        numba.set_num_threads(min(num_threads,
+                                  numba.config.NUMBA_NUM_THREADS))
+
+    def _resize(self, image: np.ndarray, size: Size,
+                **_kwargs) -> np.ndarray:
+        out = np.empty((size.height, size.width) + image.shape[2:],
+                       dtype=image.dtype)
+        resize_nearest(image, out)
+        return out
+
+    def specialize(self, shape: Tuple[int, ...], size: Sizelike,
+                   dtype: type = np.uint8) -> Callable[[np.ndarray],
+                                                       np.ndarray]:
+        """Obtain a resize function for fixed input shape and target
+        size.  The returned function writes into a preallocated
+        buffer, that is, the result is overwritten by the next call.
+        """
+        size = Size(size)
+        out = np.empty((size.height, size.width) + tuple(shape[2:]),
+                       dtype=dtype)
+
+        def resizer(image: np.ndarray) -> np.ndarray:
+            resize_nearest(image, out)
+            return out
+        return resizer
+
+    @staticmethod
+    def normalize(image: np.ndarray, mean, std,
+                  dtype: type = np.float32) -> np.ndarray:
+        """Normalize an image of shape `(H, W, C)` by subtracting
+        `mean` and dividing by `std` (scalars or per channel values).
+        """
+        channels = image.shape[2]
+        mean = np.broadcast_to(np.asarray(mean, dtype=dtype), (channels,))
+        inverse_std = np.broadcast_to(1. / np.asarray(std, dtype=dtype),
+                                      (channels,))
+        out = np.empty(image.shape, dtype=dtype)
+        normalize(image, np.ascontiguousarray(mean),
+                  np.ascontiguousarray(inverse_std), out)
+        return out
@@ -3,7 +3,7 @@ classes mapping the toolbox API onto the opencv library.
 """
 
 # standard imports
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Callable
 import logging
 import threading
 
@@ -76,7 +76,12 @@ class ImageIO(image.ImageReader, image.ImageWriter):
         #    It specifies to load an image as such including alpha
         #    channel. Alternatively, we can pass integer value -1 for
         #    this flag.
-        return cv2.cvtColor(cv2.imread(filename), cv2.COLOR_BGR2RGB)
+        image = cv2.imread(filename)
+        if image is None:
+            raise FileNotFoundError(f"OpenCV could not read image "
+                                    f"'{filename}'.")
+        # convert BGR to RGB in place (no second buffer)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
 
     def write(self, image: Imagelike, filename: str, **kwargs) -> None:
         cv2.imwrite(filename,
@@ -150,10 +155,40 @@ class ImageUtils(image.ImageResizer, image.ImageWarper):
     """
     """
 
-    def resize(self, image: np.ndarray, size=(640, 360)) -> np.ndarray:
+    @classmethod
+    def configure(cls, num_threads: int = 1) -> None:
+        """Configure the number of threads used by OpenCV.
+        """
+        cv2.setNumThreads(num_threads)
+
+    def _resize(self, image: np.ndarray, size: Size,
+                **_kwargs) -> np.ndarray:
         """Resize the frame to a smaller resolution to save computation cost.
         """
-        return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+        # INTER_AREA gives moire-free results when shrinking images,
+        # while INTER_LINEAR is faster (and good) for enlarging.
+        interpolation = (cv2.INTER_AREA
+                         if size[0] < image.shape[1] else cv2.INTER_LINEAR)
+        return cv2.resize(image, size, interpolation=interpolation)
+
+    def specialize(self, shape: Tuple[int, ...], size: Sizelike,
+                   dtype: type = np.uint8) -> Callable[[np.ndarray],
+                                                       np.ndarray]:
+        """Obtain a resize function for fixed input shape and target
+        size.  The interpolation flag and the output buffer are
+        determined once, the returned function writes into that
+        buffer, that is, the result is overwritten by the next call.
+        """
+        size = Size(size)
+        out = np.empty((size.height, size.width) + tuple(shape[2:]),
+                       dtype=dtype)
+        interpolation = (cv2.INTER_AREA
+                         if size.width < shape[1] else cv2.INTER_LINEAR)
+
+        def resizer(image: np.ndarray) -> np.ndarray:
+            cv2.resize(image, size, dst=out, interpolation=interpolation)
+            return out
+        return resizer
 
     @staticmethod
     def warp(image: Imagelike, transformation: np.ndarray,
@@ -17,13 +17,14 @@ import threading
 
 # third party imports
 import numpy as np
-from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSlot
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QKeyEvent, QCloseEvent, QHideEvent
 from PyQt5.QtWidgets import QApplication
 
 # toolbox imports
 from qtgui.widgets.image import QImageView
 from ..base.image import Image, Imagelike, ImageDisplay as BaseImageDisplay
+from ..base.image import ImageGenerator
 
 # logging
 LOG = logging.getLogger(__name__)
@@ -97,6 +98,36 @@ class QImageDisplay(QImageView):
             self._application.quit()
 
 
+class QLoopThread(QThread):
+    """A :py:class:`QThread` running the main loop of some tool
+    in the background.  New images produced by the tool are not
+    displayed directly from this thread, but are handed over
+    to the GUI thread by emitting the `frame_ready` signal.
+    """
+
+    frame_ready = pyqtSignal(object)
+
+    def __init__(self, tool, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._tool = tool
+
+    def run(self) -> None:
+        """Run the main loop of the tool (in this thread).
+        """
+        LOG.info("QLoopThread: starting tool loop")
+        self._tool.loop()
+        LOG.info("QLoopThread: tool loop finished")
+
+    def image_changed(self, tool, change) -> None:
+        """Notification method to be registered with the tool.
+        This may be called from the worker thread and hence it
+        must not access the GUI, but just emit the `frame_ready`
+        signal.
+        """
+        if change.image_changed:
+            self.frame_ready.emit(tool.image)
+
+
 class ImageDisplay(BaseImageDisplay):
     """An image display that uses Qt Widgets to display an image.
 
@@ -120,10 +151,9 @@ class ImageDisplay(BaseImageDisplay):
     ----------
     _view: QImageView
         A widget to display the image.
-    _thread: QThread
-        A thread running either the main event loop or a background
-        worker (depending ont the mode of the display).
-        If this is not None, a main event loop is running.
+    _thread: QLoopThread
+        A thread running a background worker, started by
+        :py:meth:`run`.
     _application: QApplication
         A application that will be started to get an responsive user
         interface. This can only be done from the Python main thread,
@@ -137,6 +167,7 @@ class ImageDisplay(BaseImageDisplay):
 
         self._application = QApplication([])
         self._view = view or QImageDisplay(self._application)
+        self._thread = None
 
     def _show(self, image: np.ndarray, title: str = None, **kwargs) -> None:
         """Show the given image.
@@ -151,12 +182,49 @@ class ImageDisplay(BaseImageDisplay):
 
         # Setting the image for _view will trigger a paintEvent
         # (via _view.update()) which we have to make sure is processed
-        # for the image to become visible.
-        self._view.setImage(image)
+        # for the image to become visible.  The view keeps the array
+        # for later repaints, so we have to pass a copy (the array
+        # may be the frame buffer that is reused for the next image).
+        self._view.setImage(image.copy())
 
         title = "Qt" if title is None else f"Qt: {title}"
         self._view.setWindowTitle(title)
 
+    def run(self, tool) -> None:
+        """Monitor the operation of a tool.  The main loop of the
+        tool is run in a background :py:class:`QThread`, while the
+        Qt main event loop is executed in the calling thread (which
+        should be the main thread).  New images are passed from the
+        worker to the GUI thread by a queued signal, so that the
+        display is only accessed from the GUI thread.
+        """
+        self._thread = QLoopThread(tool)
+        self._thread.frame_ready.connect(self.onFrameReady,
+                                         Qt.QueuedConnection)
+        self.observe(tool, interests=ImageGenerator.Change('image_changed'),
+                     notify=self._thread.image_changed)
+        try:
+            with self:
+                self._thread.start()
+                self._run_blocking_event_loop()
+        except KeyboardInterrupt:
+            LOG.warning("Qt: run: keyboard interrupt.")
+        finally:
+            tool.stop()
+            self.unobserve(tool)
+            self._thread.quit()
+            self._thread.wait()
+            self._thread.frame_ready.disconnect(self.onFrameReady)
+            self._thread = None
+
+    @pyqtSlot(object)
+    def onFrameReady(self, image: np.ndarray) -> None:
+        """Slot connected to the `frame_ready` signal of the
+        background worker (:py:class:`QLoopThread`).  It is run in
+        the GUI thread and displays the new image.
+        """
+        self._show(Image.as_array(image, dtype=np.uint8))
+
     def _open(self) -> None:
         LOG.info("Qt: open: show the window")
         self._view.show()
@@ -0,0 +1,78 @@
+"""Testsuite for the `dltb.thirdparty.numba` module.
+"""
+# standard imports
+from unittest import TestCase, skipUnless
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from .. import available, import_class
+
+
+@skipUnless(available('numba'), "Skip numba tests")
+class TestNumba(TestCase):
+    """Tests for the Numba kernels.
+    """
+
+    def setUp(self):
+        ImageResizer = import_class('dltb.thirdparty.numba.image.ImageUtils')
+        self._image_resizer = ImageResizer()
+        self._image = np.arange(4*6*3, dtype=np.uint8).reshape(4, 6, 3)
+
+    def test_resize(self):
+        """Test nearest neighbour resizing.
+        """
+        resized = self._image_resizer.resize(self._image, size=(3, 2))
+        self.assertEqual(resized.shape, (2, 3, 3))
+        self.assertEqual(resized.dtype, np.uint8)
+        self.assertTrue(np.array_equal(resized, self._image[::2, ::2]))
+
+    def test_specialize(self):
+        """Test the specialized resize function.
+        """
+        resizer = self._image_resizer.specialize(self._image.shape, (3, 2))
+        resized = resizer(self._image)
+        self.assertEqual(resized.shape, (2, 3, 3))
+        self.assertTrue(np.array_equal(resized, self._image[::2, ::2]))
+        self.assertIs(resizer(self._image), resized)
+
+    def test_configure(self):
+        """Test restricting the number of threads.
+        """
+        # pylint: disable=import-outside-toplevel
+        import numba
+        num_threads = numba.get_num_threads()
+        try:
+            type(self._image_resizer).configure(num_threads=1)
+            self.assertEqual(numba.get_num_threads(), 1)
+        finally:
+            numba.set_num_threads(num_threads)
+
+    def test_tile_into(self):
+        """Test arranging images in a grid.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..numba import tile_into
+        images = np.stack([self._image, 255 - self._image])
+        out = np.zeros((4, 12, 3), dtype=np.uint8)
+        tile_into(images, out, 4, 6, 2)
+        self.assertTrue(np.array_equal(out[:, :6], images[0]))
+        self.assertTrue(np.array_equal(out[:, 6:], images[1]))
+
+    def test_rgb_to_hsv(self):
+        """Test conversion into HSV colorspace.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..numba import rgb_to_hsv
+        rgb = np.array([[[0., 0., 1.], [.5, .5, .5]]])
+        hsv = np.empty(rgb.shape, dtype=np.float32)
+        rgb_to_hsv(rgb, 1., hsv)
+        self.assertTrue(np.allclose(hsv, [[[240, 1, 1], [0, 0, .5]]]))
+
+    def test_normalize(self):
+        """Test normalization.
+        """
+        normalized = self._image_resizer.normalize(self._image, 10, 2)
+        self.assertEqual(normalized.dtype, np.float32)
+        self.assertTrue(np.allclose(normalized, (self._image - 10.) / 2))
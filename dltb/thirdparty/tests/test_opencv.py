@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from .. import import_class
 
 
@@ -12,3 +14,13 @@ class TestOpencv(TestCase):
     def test_imread1(self):
         image = self._image_reader.read('assets/logo.png')
         self.assertEqual(image.shape, (469, 469, 3))
+
+    def test_specialize(self):
+        ImageResizer = import_class('ImageResizer', 'opencv')
+        resizer = ImageResizer()
+        image = self._image_reader.read('assets/logo.png')
+        specialized = resizer.specialize(image.shape, (100, 50))
+        resized = specialized(image)
+        self.assertEqual(resized.shape, (50, 100, 3))
+        self.assertTrue(np.array_equal(resized,
+                                       resizer.resize(image, (100, 50))))
@@ -150,6 +150,7 @@ from typing import Iterable
 import torch
 
 # toolbox imports
+from dltb.tool.classifier import ImageClassifier
 from dltb.thirdparty.datasource.imagenet import ImagenetClassifier
 from .network import ImageNetwork, ClassifierNetwork
 
@@ -157,7 +158,8 @@ from .network import ImageNetwork, ClassifierNetwork
 DEFAULT_GITHUB = 'pytorch/vision:v0.6.0'
 
 
-class Network(ImageNetwork, ClassifierNetwork, ImagenetClassifier):
+class Network(ImageNetwork, ImageClassifier, ClassifierNetwork,
+              ImagenetClassifier):
     """An network to be initialized from a torch hub pretrained model.
 
     Arguments
@@ -1193,6 +1193,21 @@ class ImageNetwork(BaseImageNetwork, Network):
         """
         return self._preprocess_pil_image(image)
 
+    def device_normalize(self, data: Union[np.ndarray, torch.Tensor],
+                         mean, std) -> torch.Tensor:
+        """Normalize a (batch of) `uint8` image(s) in channel last
+        format on the device of this :py:class:`Network`.  Only the
+        `uint8` data are transferred, the conversion to float is done
+        on the device.
+        """
+        dtype = self.normalized_dtype
+        dtype = getattr(torch, dtype if isinstance(dtype, str) else
+                        np.dtype(dtype).name)
+        tensor = torch.as_tensor(data).to(self._device)
+        mean = torch.as_tensor(mean, dtype=dtype, device=self._device)
+        std = torch.as_tensor(std, dtype=dtype, device=self._device)
+        return tensor.to(dtype).div_(255).sub_(mean).div_(std)
+
     # FIXME[hack]: image_to_internal of super class should made more general,
     # so that overwriting that method is not necessary.
     # This ad hoc function only works for a single image, not for a batch
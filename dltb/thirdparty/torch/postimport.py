@@ -25,31 +25,61 @@ from ...datasource import Datasource
 LOG = logging.getLogger(__name__)
 
 
-def as_torch(data: Datalike, copy: bool = False) -> torch.Tensor:
-    """Get a :py:class:`torch.Tensor` from a :py:class:`Datalike`
-    object.
-    """
-    if isinstance(data, torch.Tensor):
-        return data.clone().detach() if copy else data
+def _tensor_as_torch(data: torch.Tensor, copy: bool) -> torch.Tensor:
+    return data.clone().detach() if copy else data
 
-    if isinstance(data, str) and data.endswith('.pt'):
+
+def _array_as_torch(data: np.ndarray, copy: bool) -> torch.Tensor:
+    # from_numpy() will use the same data as the numpy array, that
+    # is changing the torch.Tensor will also change the numpy.ndarray.
+    # It can not handle negative strides (e.g. flipped images), so
+    # such arrays are made C-contiguous first, which implies a copy.
+    if copy or any(stride < 0 for stride in data.strides):
+        contiguous = np.ascontiguousarray(data)
+        tensor = torch.from_numpy(contiguous)
+        # copy the data, unless ascontiguousarray() already did
+        # (clone() avoids the element type inference of torch.tensor(),
+        # see torch bug: https://github.com/pytorch/pytorch/issues/24807)
+        return tensor.clone() if copy and contiguous is data else tensor
+    return torch.from_numpy(data)
+
+
+def _data_as_torch(data: Data, copy: bool) -> torch.Tensor:
+    if not hasattr(data, 'torch'):
+        data.add_attribute('torch', Data.as_torch(data.array, copy=copy))
+    return data.torch
+
+
+def _str_as_torch(data: str, copy: bool) -> torch.Tensor:
+    if data.endswith('.pt'):
         return torch.load(data)
+    return _array_as_torch(Data.as_array(data), copy)
 
-    if isinstance(data, Data):
-        if not hasattr(data, 'torch'):
-            data.add_attribute('torch', Data.as_torch(data.array, copy=copy))
-        return data.torch
 
-    if not isinstance(data, np.ndarray):
-        data = Data.as_array(data)
+# _AS_TORCH: conversion functions for the common types, looked up by
+# the exact type of the argument (subclasses are handled by
+# as_torch() using isinstance)
+_AS_TORCH = {
+    torch.Tensor: _tensor_as_torch,
+    np.ndarray: _array_as_torch,
+    Data: _data_as_torch,
+    str: _str_as_torch,
+}
 
-    # from_numpy() will use the same data as the numpy array, that
-    # is changing the torch.Tensor will also change the numpy.ndarray.
-    # On the other hand, torch.tensor() will always copy the data.
 
-    # pylint: disable=not-callable
-    # torch bug: https://github.com/pytorch/pytorch/issues/24807
-    return torch.tensor(data) if copy else torch.from_numpy(data)
+def as_torch(data: Datalike, copy: bool = False) -> torch.Tensor:
+    """Get a :py:class:`torch.Tensor` from a :py:class:`Datalike`
+    object.
+    """
+    convert = _AS_TORCH.get(type(data))
+    if convert is not None:
+        return convert(data, copy)
+
+    for cls in (torch.Tensor, str, Data, np.ndarray):
+        if isinstance(data, cls):
+            return _AS_TORCH[cls](data, copy)
+
+    return _array_as_torch(Data.as_array(data), copy)
 
 
 LOG.info("Adapting dltb.base.data.Data: adding static method 'as_torch'")
@@ -21,11 +21,13 @@ import torch
 import torchvision.models
 
 # toolbox imports
+from dltb.tool.classifier import ImageClassifier
 from dltb.thirdparty.datasource.imagenet import ImagenetClassifier
 from .network import ImageNetwork, ClassifierNetwork
 
 
-class Network(ImageNetwork, ClassifierNetwork, ImagenetClassifier):
+class Network(ImageNetwork, ImageClassifier, ClassifierNetwork,
+              ImagenetClassifier):
     """Convenience class to access torchvision models in the Deep Learning
     Toolbox.
     """
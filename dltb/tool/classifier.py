@@ -465,7 +465,7 @@ class Classifier(ABC, Preparable):
                 self.scheme.identifier(index, lookup=self._lookup))
 
 
-class ImageClassifier(ImageExtension, base=Classifier):
+class ImageClassifier(ImageExtension, Classifier, base=Classifier):
     """An :py:class:`ImageClassifier` is can classify images.
     """
 
@@ -491,8 +491,8 @@ class ImageDetector(Detector, ImageTool):
             An image in which the given detections are visually marked.
         """
         array = Image.as_array(image, copy=copy)
-        # array.setflags(write=True)
-        array = array.copy()  # FIXME[why]: was alread copied above
+        if not array.flags.writeable:
+            array = array.copy()
         if detections is None:
             detections = self.detect(Image(array))
         if detections:
@@ -571,7 +571,8 @@ class ImageDetector(Detector, ImageTool):
         extractions = []
         if detections:
             for region in detections.regions:
-                extractions.append(region.location.extract(array, copy=copy))
+                extractions.append(region.location.
+                                   extract_from_image(array, copy=copy))
         return extractions
 
     def extract_data(self, data: Data,
@@ -1,7 +1,8 @@
 """General numpy helper functions.
 """
 # standard imports
-from typing import Optional
+from typing import Optional, Tuple
+import importlib.util
 
 # third-party imports
 import numpy as np
@@ -128,3 +129,33 @@ def argmultimax(array: np.ndarray, num: int = 1, axis: Optional[int] = None,
         The indices of the `top` values.
     """
     return argmultimin(-array, num=num, axis=axis, sort=sort)
+
+
+def statistics(array: np.ndarray) -> Tuple[float, float, float, float]:
+    """Compute basic statistics of an array.  For floating point
+    arrays, if Numba is available, the values are computed in two
+    passes over the data, instead of one pass per statistic.
+
+    Arguments
+    ---------
+    array:
+        The array (of arbitrary shape) for which statistics should
+        be computed.
+
+    Result
+    ------
+    minimum, maximum, mean, std:
+        The minimum, maximum, mean, and standard deviation of all
+        values in the array.  Minimum and maximum have the dtype
+        of the array.
+    """
+    if (array.size and np.issubdtype(array.dtype, np.floating) and
+            importlib.util.find_spec('numba') is not None):
+        # pylint: disable=import-outside-toplevel
+        from ..thirdparty.numba import statistics as statistics_kernel
+        values = np.ascontiguousarray(array).reshape(-1)
+        minimum, maximum, mean, variance = statistics_kernel(values)
+        if np.isfinite(mean):  # otherwise let numpy handle nan/inf
+            return (array.dtype.type(minimum), array.dtype.type(maximum),
+                    mean, np.sqrt(variance))
+    return array.min(), array.max(), array.mean(), array.std()
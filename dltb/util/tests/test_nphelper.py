@@ -69,3 +69,39 @@ class TestNPHelper(TestCase):
         top = -np.sort(-values, axis=1)
         top2 = nphelper.multimax(values, num=2, axis=1, sort=True)
         self.assertTrue(np.array_equal(top2, top[:, :2]))
+
+    def test_statistics(self):
+        """Test `nphelper.statistics` against the numpy reductions.
+        """
+        values = np.random.rand(4, 5, 3).astype(np.float32)
+        minimum, maximum, mean, std = nphelper.statistics(values)
+        self.assertEqual(minimum, values.min())
+        self.assertEqual(maximum, values.max())
+        self.assertAlmostEqual(mean, values.mean(), places=5)
+        self.assertAlmostEqual(std, values.std(), places=5)
+
+        values = np.asarray([1., np.nan, 3.])
+        self.assertTrue(np.isnan(nphelper.statistics(values)[0]))
+
+    def test_statistics_precision(self):
+        """Test that `nphelper.statistics` computes a small standard
+        deviation around a large mean without cancellation.
+        """
+        values = (1e4 + np.linspace(-.005, .005, 1001)).astype(np.float32)
+        std = nphelper.statistics(values)[3]
+        self.assertAlmostEqual(std, values.std(dtype=np.float64), places=6)
+        self.assertGreater(std, 0.)
+
+    def test_statistics_dtypes(self):
+        """Test `nphelper.statistics` on non-float arrays.
+        """
+        minimum, maximum, mean, _std = \
+            nphelper.statistics(np.asarray([True, False, True]))
+        self.assertEqual((minimum, maximum), (False, True))
+        self.assertAlmostEqual(mean, 2/3)
+
+        values = np.asarray([2**62 + 1, 3], dtype=np.int64)
+        minimum, maximum, _mean, _std = nphelper.statistics(values)
+        self.assertEqual(maximum, 2**62 + 1)
+        self.assertEqual(maximum.dtype, np.int64)
+        self.assertEqual(minimum, 3)
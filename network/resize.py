@@ -9,11 +9,34 @@ contain a resized version of the original image.
 .. moduleauthor:: Rasmus Diederichsen
 """
 
+# standard imports
+from functools import partial
+import importlib.util
+import logging
+
 # third party imports
 import numpy as np
 
 # toolbox imports
 from dltb.network import Network
+from dltb.util.image import imresize
+
+# logging
+LOG = logging.getLogger(__name__)
+
+# _CV2_BORDERS: OpenCV border types for the `np.pad` modes supported
+# by `cv2.copyMakeBorder`
+_CV2_BORDERS = {
+    'constant': 'BORDER_CONSTANT',
+    'edge': 'BORDER_REPLICATE',
+    'reflect': 'BORDER_REFLECT_101',
+    'symmetric': 'BORDER_REFLECT',
+    'wrap': 'BORDER_WRAP',
+}
+
+# _CV2_DTYPES: the dtypes supported by `cv2.copyMakeBorder`
+_CV2_DTYPES = (np.uint8, np.int8, np.uint16, np.int16, np.int32,
+               np.float32, np.float64)
 
 
 class _ResizePolicyBase(object):
@@ -46,15 +69,25 @@ class _ResizePolicyBase(object):
             # remove channel dim
             new_shape = new_shape[:-1]
         self._new_shape = new_shape
+        # from now on, resize images (instead of checking for a
+        # shape on every call of resize)
+        self.resize = self._resize
 
     def resize(self, image):
-        """Resize an image according to this policy.
+        """Resize an image according to this policy.  As long as no
+        shape has been set, the image is returned unchanged.
 
         Parameters
         ----------
         image   :   np.ndarray
                     Image to resize
         """
+        return image
+
+    def _resize(self, image):
+        """Resize an image to the shape set by :py:meth:`setShape`.
+        Subclasses have to implement this method.
+        """
         raise NotImplementedError("Abstract base class ResizePolicy "
                                   "cannot be used directly.")
 
@@ -65,17 +98,12 @@ class ResizePolicyBilinear(_ResizePolicyBase):
 
     """
 
-    def resize(self, img):
-        from dltb.util.image import imresize
-
-        if self._new_shape is None:
-            return img
-
+    def _resize(self, img):
         if self._new_shape[0:2] == img.shape[0:2]:
             return img
 
-        # return resize(img, self._new_shape, preserve_range=True)
-        return imresize(img, self._new_shape[0:2])
+        # imresize expects the size as (width, height)
+        return imresize(img, (self._new_shape[1], self._new_shape[0]))
 
 
 class ResizePolicyPad(_ResizePolicyBase):
@@ -98,29 +126,60 @@ class ResizePolicyPad(_ResizePolicyBase):
         self._pad_mode = mode
         self._pad_kwargs = kwargs
 
-    def resize(self, img):
-        if self._new_shape is None or self._new_shape == img.shape:
+        # OpenCV's copyMakeBorder is used instead of np.pad, if available
+        # and supporting the mode (and a single constant value)
+        self._copy_make_border = None
+        value = kwargs.get('constant_values', 0)
+        if (mode in _CV2_BORDERS and set(kwargs) <= {'constant_values'} and
+                np.isscalar(value) and
+                importlib.util.find_spec('cv2') is not None):
+            # pylint: disable=import-outside-toplevel
+            import cv2
+            # the value has to be given for all (up to 4) channels
+            self._copy_make_border = \
+                partial(cv2.copyMakeBorder,
+                        borderType=getattr(cv2, _CV2_BORDERS[mode]),
+                        value=(value,) * 4)
+        # pad widths per (image shape, target shape), as usually all
+        # images share the same shape
+        self._pad_cache = {}
+
+    def _resize(self, img):
+        if self._new_shape == img.shape:
             return img
-        h, w = img.shape[:2]
-        new_h, new_w = self._new_shape[:2]
-
-        if new_h < h or new_w < w:
-            raise ValueError("Cannot pad to a smaller size. "
-                             "Use `ResizePolicy.Crop` instead.")
-
-        # necessary padding to reach desired size
-        pad_h = new_h - h
-        pad_w = new_w - w
-
-        # If padding is not even, we put one more padding pixel to the
-        # bottom/right
-        top = pad_h // 2
-        bottom = pad_h - top
-        left = pad_w // 2
-        right = pad_w - left
-
-        return np.pad(img, (top, bottom, left, right), self._pad_mode,
-                      **self._pad_kwargs)
+        key = (img.shape, self._new_shape)
+        pad_width = self._pad_cache.get(key)
+        if pad_width is None:
+            h, w = img.shape[:2]
+            new_h, new_w = self._new_shape[:2]
+
+            if new_h < h or new_w < w:
+                raise ValueError("Cannot pad to a smaller size. "
+                                 "Use `ResizePolicy.Crop` instead.")
+
+            # necessary padding to reach desired size
+            pad_h = new_h - h
+            pad_w = new_w - w
+
+            # If padding is not even, we put one more padding pixel to
+            # the bottom/right.  np.pad expects one (before, after)
+            # pair per axis.
+            pad_width = ((pad_h // 2, pad_h - pad_h // 2),
+                         (pad_w // 2, pad_w - pad_w // 2)) + \
+                ((0, 0),) * (img.ndim - 2)
+            self._pad_cache[key] = pad_width
+
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Padding image of shape %s to shape %s",
+                      img.shape, self._new_shape)
+        # copyMakeBorder supports at most 4 channels and drops a
+        # single channel axis
+        if (self._copy_make_border is not None and
+                img.dtype in _CV2_DTYPES and
+                (img.ndim == 2 or (img.ndim == 3 and 1 < img.shape[2] <= 4))):
+            (top, bottom), (left, right) = pad_width[:2]
+            return self._copy_make_border(img, top, bottom, left, right)
+        return np.pad(img, pad_width, self._pad_mode, **self._pad_kwargs)
 
 
 class ResizePolicyChannels(_ResizePolicyBase):
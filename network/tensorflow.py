@@ -13,6 +13,7 @@ from dltb.thirdparty.tensorflow.v1 import tf
 # toolbox imports
 from dltb.network import Network as BaseNetwork, NetworkParsingError
 from dltb.network.network import ImageNetwork, Classifier
+from dltb.tool.classifier import ImageClassifier
 from .layers.tensorflow_layers import TensorFlowLayer as Layer
 from .layers.tensorflow_layers import TensorFlowNeuralLayer as NeuralLayer
 from .layers.tensorflow_layers import TensorFlowStridingLayer as StridingLayer
@@ -796,11 +797,15 @@ class Network(BaseNetwork):
         return tuple(self.get_input_tensor().shape.as_list())
 
 
-class Alexnet(Classifier, ImageNetwork, Network):
+class Alexnet(ImageClassifier, Classifier, ImageNetwork, Network):
     """
     AlexNet trained on ImageNet data (TensorFlow).
     """
 
+    # the internal representation (image_to_internal) is centered float
+    dtype = np.float32
+    internal_shape = (227, 227, 3)
+
     def __init__(self, *args, key: str = 'AlexNet',
                  scheme: str = 'ImageNet', lookup: str = 'caffe',
                  **kwargs) -> None:
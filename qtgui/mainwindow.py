@@ -675,9 +675,13 @@ class DeepVisMainWindow(QMainWindow, QObserver, QDebug, qobservables={
             description = f"Dropped in image ({filename})"
             LOG.info("Converted URL to local filename: '%s'", filename)
 
-            # 3. Set this file as input image for the toolbox.
+            # 3. Set this file as input image for the toolbox.  Reading
+            #    and decoding the image is done in a background thread
+            #    to keep the GUI responsive (observers are notified
+            #    in the main thread via QObserver).
             self._toolbox.set_input_from_file(filename,
-                                              description=description)
+                                              description=description,
+                                              run=True)
 
             # 4. Mark the Drop action as accepted (we actually perform
             #    a CopyAction, no matter what was proposed)
@@ -166,6 +166,12 @@ class ActivationsPanel(Panel, QObserver, qobservables={
         self._initUI()
         self._layoutUI()
 
+        # bind methods of the image view that are called for every
+        # unit/position change (e.g., when dragging over the
+        # activation view) to avoid repeated attribute lookups.
+        self._setMask = self._imageView.setMask
+        self._setReceptiveField = self._imageView.setReceptiveField
+
         self._activationTool = \
             ActivationTool(data_format=DATA_FORMAT_CHANNELS_FIRST)
         worker = ActivationWorker(tool=self._activationTool)
@@ -414,11 +420,11 @@ class ActivationsPanel(Panel, QObserver, qobservables={
         """Display the current activations as mask in the image view.
         """
         if self._activationWorker is None or self._unit is None:
-            self._imageView.setMask(None)
+            self._setMask(None)
             return
 
         if self._layerID is None:
-            self._imageView.setMask(None)
+            self._setMask(None)
             return
 
         activations = self._activationWorker.activations(self._layerID,
@@ -429,14 +435,14 @@ class ActivationsPanel(Panel, QObserver, qobservables={
         if activations is not None and activations.ndim > 1:
             # exclude dense layers
             activationMask = grayscaleNormalized(activations)
-            self._imageView.setMask(activationMask)
+            self._setMask(activationMask)
             # field = engine.receptive_field
             # if field is not None:
             #    self.addMark(QRect(field[0][1], field[0][0],
             #                       field[1][1]-field[0][1],
             #                       field[1][0]-field[0][0]))
         else:
-            self._imageView.setMask(None)
+            self._setMask(None)
 
     def updateReceptiveField(self) -> None:
         """Show the current receptive field in the image view.
@@ -445,14 +451,13 @@ class ActivationsPanel(Panel, QObserver, qobservables={
         # of the network input layer in format ((x1,y1), (x2,y2))
         field = self._receptiveField
         network = self.network()
-        print(f"AcivationsPanel: receptive field={field}, "
-              f"network: {network and network.get_input_shape(False, False)}")
+        LOG.debug("QActivationsPanel: receptive field=%s", field)
         if field is None or network is None:
-            self._imageView.setReceptiveField(None, None)
+            self._setReceptiveField(None, None)
         else:
             rect = QRect(QPoint(*field[0]), QPoint(*field[1]))
             reference = QSize(*network.get_input_shape(False, False))
-            self._imageView.setReceptiveField(rect, reference)
+            self._setReceptiveField(rect, reference)
 
     #
     # Slots
@@ -484,7 +489,6 @@ class ActivationsPanel(Panel, QObserver, qobservables={
         else:
             point = (position.x(), position.y())
             self._receptiveField = layer.receptive_field(point)
-        print(f"AcivationsPanel: New receptive field is: {self._receptiveField}")
         self.updateReceptiveField()
 
     @protect
@@ -9,7 +9,7 @@ This module provides widgets for viewing data and metadata.
 
 # standard imports
 from typing import Any, Union, Optional, Sequence, Mapping
-from typing import AbstractSet, Callable
+from typing import AbstractSet, Callable, Tuple
 import os
 import json
 import logging
@@ -32,6 +32,7 @@ from dltb.base.meta import Metadata
 from dltb.base.image import Region, PointsBasedLocation, Landmarks
 from dltb.datasource import Datasource, Datafetcher
 from dltb.tool.classifier import ClassIdentifier
+from dltb.util.nphelper import statistics
 
 # GUI imports
 from ..utils import QObserver, protect
@@ -155,6 +156,12 @@ class QDataInfoBox(QWidget, QObserver, qobservables={
     }
     _processed: bool = False
 
+    # template for the data text, filled by one `format_map` per update
+    _DATA_TMPL: str = ('<b>{header}</b><br>\n'
+                       'Input shape: {shape}, dtype={dtype}<br>\n'
+                       'min = {mn}, max={mx}, mean={mean:5.2f}, '
+                       'std={std:5.2f}\n')
+
     statisticsChanged = pyqtSignal(bool)
 
     def __init__(self, toolbox: Optional[Toolbox] = None,
@@ -176,6 +183,13 @@ class QDataInfoBox(QWidget, QObserver, qobservables={
         self._dataText = ""
         self._data = None
         self._statistics = False
+        # _statisticsCache: the last array for which statistics were
+        # computed and the statistics (min, max, mean, std), allowing
+        # to skip recomputation on repeated notifications and when
+        # toggling the display.  Only read-only arrays are cached, as
+        # writeable arrays (e.g., activation buffers) may be changed
+        # in place without becoming a new object.
+        self._statisticsCache: Optional[Tuple[np.ndarray, tuple]] = None
         self._initUI()
         self._layoutUI()
         self.setToolbox(toolbox)
@@ -411,17 +425,24 @@ class QDataInfoBox(QWidget, QObserver, qobservables={
         # if label is not None:
         #     self._metaText += f'Label: {label}<br>\n'
 
-        self._dataText = ('<b>Preprocessed input:</b><br>\n'
-                          if self._processed else
-                          '<b>Raw input:</b><br>\n')
-        if data is not None:
-            array = data.array
-            self._dataText += (f'Input shape: {array.shape}, '
-                               f'dtype={array.dtype}<br>\n')
-            self._dataText += ('min = {}, max={}, mean={:5.2f}, '
-                               'std={:5.2f}\n'.
-                               format(array.min(), array.max(),
-                                      array.mean(), array.std()))
+        header = 'Preprocessed input:' if self._processed else 'Raw input:'
+        if data is None:
+            self._dataText = f'<b>{header}</b><br>\n'
+            return
+
+        array = data.array
+        if (self._statisticsCache is not None and
+                self._statisticsCache[0] is array):
+            stats = self._statisticsCache[1]
+        else:
+            stats = statistics(array)
+            self._statisticsCache = \
+                None if array.flags.writeable else (array, stats)
+        mn, mx, mean, std = stats
+        self._dataText = self._DATA_TMPL.format_map({
+            'header': header, 'shape': array.shape, 'dtype': array.dtype,
+            'mn': mn, 'mx': mx, 'mean': mean, 'std': std
+        })
 
     def update(self):
         """Update the information displayed by this :py:class:`QDataInfoBox`.
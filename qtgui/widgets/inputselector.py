@@ -202,14 +202,10 @@ class QInputNavigator(QWidget, QObserver, qobservables={
         (3) change of selected image (data_changed): we may want to
             reflect the selection in our controls.
         """
-        if info.observable_changed:
-            self._updateState()
-            self._enableUI()
-
         if info.observable_changed or info.state_changed:
             self._updateDescription(datasource)
 
-        if info.state_changed or info.busy_changed:
+        if info.observable_changed or info.state_changed or info.busy_changed:
             self._updateState()
             self._enableUI()
 
@@ -1,12 +1,14 @@
 
 
 # standard imports
-import os
+from collections import deque, namedtuple
 import logging
+import threading
 import traceback
 
 # Qt imports
-from PyQt5.QtCore import pyqtSignal, pyqtSlot
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import QPlainTextEdit
 
 # toolbox imports
@@ -18,6 +20,17 @@ from ..utils import protect
 # logging
 LOG = logging.getLogger(__name__)
 
+# _RecordLocation: the source location of a log record (the rest of the
+# logging.LogRecord is not needed after formatting)
+_RecordLocation = namedtuple('_RecordLocation', ['pathname', 'lineno'])
+
+
+def _inline(message: str) -> str:
+    """Escape line breaks in a message, so that it can be displayed
+    as a single line (block).
+    """
+    return message.replace('\r\n', '\\n').replace('\n', '\\n')
+
 
 class QLogHandler(QPlainTextEdit, logging.Handler):
     """A log handler that displays log messages in a QWidget.
@@ -25,18 +38,53 @@ class QLogHandler(QPlainTextEdit, logging.Handler):
     A :py:class:`QLogHandler` can be used 
     """
 
+    # _message_signal: emitted (in the GUI thread) after new messages
+    # have been appended, with the appended messages as argument
     _message_signal = pyqtSignal(str)
 
+    # _pending_signal: emitted (from any thread) when messages are
+    # waiting to be appended
+    _pending_signal = pyqtSignal()
+
+    # _flushInterval: time (in milliseconds) to collect messages
+    # before appending them to the text in one go
+    _flushInterval: int = 50
+
+    # _maxRecords: the maximal number of records (lines) kept, older
+    # records are discarded
+    _maxRecords: int = 10000
+
     def __init__(self, parent=None):
         # FIXME[question]: can we use real python multiple inheritance here?
         # (that is just super().__init__(*args, **kwargs))
         QPlainTextEdit.__init__(self, parent)
         logging.Handler.__init__(self)
         self.setReadOnly(True)
-        self._records = []
+        self.setMaximumBlockCount(self._maxRecords)
+        # a log is not edited: do not record insertions for undo
+        self.setUndoRedoEnabled(False)
+        # do not wrap lines: log records are one line each, and
+        # wrapping requires relayouting all blocks on resize
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # _cursor: a cursor used to append text at the end of the document
+        self._cursor = QTextCursor(self.document())
+        # _records: the locations of the most recent records.  Each
+        # text block displaying a record has the (running) number of
+        # that record as user state, _recordCount is the total number
+        # of records.
+        self._records = deque(maxlen=self._maxRecords)
+        self._recordCount = 0
         self._counter = 1
-        self._message_signal.connect(self.appendMessage)
-        self._message_signal.emit("Log view initialized")
+        # _pending: formatted messages not yet appended to the text,
+        # guarded by _pendingLock (emit may be called from any thread)
+        self._pending = deque()
+        self._pendingLock = threading.Lock()
+        # _pending_signal is the only contact point between emit()
+        # (called from any thread) and the widget: always queue it
+        # into the GUI thread
+        self._pending_signal.connect(self._scheduleFlush,
+                                     Qt.QueuedConnection)
+        self.appendMessage("Log view initialized")
 
     def __len__(self):
         """The number of lines in this QLogHandler.
@@ -47,15 +95,54 @@ class QLogHandler(QPlainTextEdit, logging.Handler):
         """Clear this :py:class:QLogHandler.
         """
         super().clear()
-        self._records.clear()
-        self._counter = 1
-        self._message_signal.emit("Log view cleared")
+        with self._pendingLock:
+            self._pending.clear()
+            self._records.clear()
+            self._recordCount = 0
+            self._counter = 1
+        self.appendMessage("Log view cleared")
 
     @pyqtSlot(str)
     def appendMessage(self, message: str):
-        message = message.replace(os.linesep, '\\n')
-        self.appendPlainText(message)
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        self._appendLines(_inline(message))
+
+    def _appendLines(self, text: str) -> None:
+        scrollBar = self.verticalScrollBar()
+        # only follow new messages if the view is scrolled to the bottom
+        atBottom = scrollBar.value() == scrollBar.maximum()
+        # insert all lines as one edit (each line becomes a block)
+        cursor = self._cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        if atBottom:
+            scrollBar.setValue(scrollBar.maximum())
+        self._message_signal.emit(text)
+
+    @pyqtSlot()
+    def _scheduleFlush(self) -> None:
+        QTimer.singleShot(self._flushInterval, self._flushMessages)
+
+    def _flushMessages(self) -> None:
+        """Append all pending messages to the text.  Each message
+        is appended as one line (block), so that block numbers
+        correspond to indices in `_records`.
+        """
+        with self._pendingLock:
+            messages, self._pending = self._pending, deque()
+            counter, number = self._counter, self._recordCount
+        if messages:
+            self.setToolTip(f"List of log records ({counter} entries)")
+            self._appendLines('\n'.join(messages))
+            # mark the new blocks with the numbers of their records
+            block = self.document().lastBlock()
+            for _ in range(min(len(messages), self._maxRecords)):
+                number -= 1
+                block.setUserState(number)
+                block = block.previous()
 
     def emit(self, record: logging.LogRecord) -> None:
         """Handle a :py:class:logging.logRecord.
@@ -65,12 +152,22 @@ class QLogHandler(QPlainTextEdit, logging.Handler):
         # crashes with the following message:
         #   QObject::connect: Cannot queue arguments of type 'QTextBlock'
         #   (Make sure 'QTextBlock' is registered using qRegisterMetaType().)
-        # Hence we are doing this via a signal now.        
-        self._counter += 1
-        self.setToolTip(f"List of log records ({self._counter} entries)")
+        # Hence we are doing this via a signal now.  To avoid updating
+        # the widget for every single record, messages are collected
+        # and appended together after a short delay (_flushInterval).
+        # escape line breaks here (in the emitting thread), so that
+        # the GUI thread can join the messages directly
+        message = _inline(self.format(record))
+        with self._pendingLock:
+            self._counter += 1
+            self._recordCount += 1
+            self._records.append(_RecordLocation(record.pathname,
+                                                 record.lineno))
+            schedule = not self._pending
+            self._pending.append(message)
         try:
-            self._records.append(record)
-            self._message_signal.emit(self.format(record))
+            if schedule:
+                self._pending_signal.emit()
         except AttributeError as error:
             # FIXME[bug/problem]
             # When quitting the program while running some background
@@ -85,12 +182,11 @@ class QLogHandler(QPlainTextEdit, logging.Handler):
 
     @protect
     def mouseReleaseEvent(self, event):
-        cursor = self.cursorForPosition(event.pos())
-        block = cursor.blockNumber()
-        print(block, len(self._records))
-        if block < len(self._records):
-            print(self._records[block])
-            record = self._records[block]
+        number = self.cursorForPosition(event.pos()).block().userState()
+        with self._pendingLock:
+            index = number - (self._recordCount - len(self._records))
+            record = self._records[index] if number >= 0 <= index else None
+        if record is not None:
             LOG.info(f"Trying to open file {record.pathname}, "
                      f"line {record.lineno}, in an external editor.")
             try:
@@ -114,6 +210,7 @@ class QExceptionView(QPlainTextEdit):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
         self._exception = None
         self._traceback = None
 
@@ -131,9 +228,9 @@ class QExceptionView(QPlainTextEdit):
         #  - lineno
         #  - locals
         #  - name
-        self.clear()
-        for m in traceback.format_list(self._traceback):
-            self.appendPlainText(m)
+        # set the text in one go: appending each frame separately
+        # makes the document relayout once per frame
+        self.setPlainText(''.join(self._traceback.format()).rstrip('\n'))
         self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
 
     @protect
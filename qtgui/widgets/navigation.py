@@ -1,8 +1,11 @@
 """Qt based navigation widgets.
 """
 
+# standard imports
+from functools import lru_cache
+
 # Qt imports
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal
 from PyQt5.QtGui import QFontMetrics, QIntValidator, QIcon
 from PyQt5.QtWidgets import QHBoxLayout, QSizePolicy
 from PyQt5.QtWidgets import QWidget, QPushButton, QLineEdit, QLabel
@@ -11,6 +14,15 @@ from PyQt5.QtWidgets import QWidget, QPushButton, QLineEdit, QLabel
 from ..utils import protect
 
 
+@lru_cache(maxsize=None)
+def _themeIcon(name: str) -> QIcon:
+    """Get an icon from the current icon theme (a null icon if the
+    theme does not provide the icon).  Results are cached, to avoid
+    repeated theme lookups when creating multiple widgets.
+    """
+    return QIcon.fromTheme(name, QIcon())
+
+
 class QIndexControls(QWidget):
     """A group of Widgets to control an index.
     The controls allow to navigate through the index.
@@ -51,6 +63,9 @@ class QIndexControls(QWidget):
         self._index = 0
         self._elements = -1
         self._one_based = True
+        # _enabledStates: the enabled states last applied to the
+        # controls by update() (None if unknown)
+        self._enabledStates = None
         super().__init__(**kwargs)
         self._initUI()
         self._layoutUI()
@@ -67,15 +82,25 @@ class QIndexControls(QWidget):
         self._nextButton = self._initButton('>>', 'go-next')
         self._lastButton = self._initButton('>|', 'go-last')
 
+        # _buttonActions: map each navigation button to the index
+        # it should select (computed at the time of the click)
+        self._buttonActions = {
+            self._firstButton: lambda: 0,
+            self._prevButton: lambda: self._index - 1,
+            self._nextButton: lambda: self._index + 1,
+            self._lastButton: lambda: self._elements - 1,
+        }
+
         # _indexField: A text field to manually enter the index of
         # desired input.
         self._indexField = QLineEdit()
         self._indexField.setMaxLength(8)
+        # _indexValidator: shared validator for the index field, its
+        # top is adapted by setElements()
+        self._indexValidator = QIntValidator(0, 0, self)
         self._indexField.setAlignment(Qt.AlignRight)
         self._indexField.setSizePolicy(
             QSizePolicy.Maximum, QSizePolicy.Maximum)
-        self._indexField.setMinimumWidth(
-            QFontMetrics(self.font()).width('8') * 8)
         # textChanged: This signal is emitted whenever the text
         # changes.  This signal is also emitted when the text is
         # changed programmatically, for example, by calling setText().
@@ -93,16 +118,32 @@ class QIndexControls(QWidget):
         self._indexField.editingFinished.connect(self.onIndexEditingFinished)
 
         self._indexLabel = QLabel()
-        self._indexLabel.setMinimumWidth(
-            QFontMetrics(self.font()).width('8') * 8)
         self._indexLabel.setSizePolicy(
             QSizePolicy.Maximum, QSizePolicy.Expanding)
 
+        self._updateMinimumWidths()
         self.update()
 
+    def _updateMinimumWidths(self) -> None:
+        """Make the index field and label wide enough to display
+        8 digits in the current font.
+        """
+        width = QFontMetrics(self.font()).horizontalAdvance('8' * 8)
+        self._indexField.setMinimumWidth(width)
+        self._indexLabel.setMinimumWidth(width)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """React to a change of the font by adapting the minimum
+        widths of the index field and label.
+        """
+        if (event.type() == QEvent.FontChange and
+                self._indexField is not None):
+            self._updateMinimumWidths()
+        super().changeEvent(event)
+
     def _initButton(self, label: str, icon: str = None):
         button = QPushButton()
-        icon = QIcon.fromTheme(icon, QIcon())
+        icon = _themeIcon(icon) if icon else QIcon()
         if icon.isNull():
             button.setText(label)
         else:
@@ -128,14 +169,9 @@ class QIndexControls(QWidget):
     @protect
     def _buttonClicked(self, checked: bool):
         """Callback for clicking the 'next' and 'prev' sample button."""
-        if self.sender() == self._firstButton:
-            self.setIndex(0, True)
-        elif self.sender() == self._prevButton:
-            self.setIndex(self._index - 1, True)
-        elif self.sender() == self._nextButton:
-            self.setIndex(self._index + 1, True)
-        elif self.sender() == self._lastButton:
-            self.setIndex(self._elements - 1, True)
+        action = self._buttonActions.get(self.sender())
+        if action is not None:
+            self.setIndex(action(), True)
 
     @protect
     def onIndexEdited(self, text: str) -> None:
@@ -160,6 +196,7 @@ class QIndexControls(QWidget):
         # the line editor, we can force closing it.
         self._indexField.setEnabled(False)
         self._indexField.setEnabled(True)
+        self._enabledStates = None  # let update() reapply all states
 
     def _editIndex(self, text):
         """Transform the given text into an index value and set
@@ -197,7 +234,9 @@ class QIndexControls(QWidget):
         if elements != self._elements:
             self._elements = elements
             if elements > 0:
-                self._indexField.setValidator(QIntValidator(0, elements))
+                self._indexValidator.setTop(elements)
+                if self._indexField.validator() is not self._indexValidator:
+                    self._indexField.setValidator(self._indexValidator)
             else:
                 self._indexField.setValidator(None)
 
@@ -206,16 +245,24 @@ class QIndexControls(QWidget):
         """
         have_elements = self._elements > 0
         enabled = enabled and have_elements
-        self._firstButton.setEnabled(enabled and self._index > 0)
-        self._prevButton.setEnabled(enabled and self._index > 0)
-        self._nextButton.setEnabled(enabled and self._index+1 < self._elements)
-        self._lastButton.setEnabled(enabled and self._index+1 < self._elements)
+        backward = enabled and self._index > 0
+        forward = enabled and self._index+1 < self._elements
 
         # The value of `enabled` may change quickly (e.g. if an underlying
         # object becomes busy due to an index change). While reflecting
         # this change of state seems ok for the buttons, it is harmful for
         # the QLineEdit, as disabling leads to closing the editor.
-        self._indexField.setEnabled(have_elements)
+        states = (backward, backward, forward, forward, have_elements)
+
+        # only change the controls whose state differs from the last update
+        last = self._enabledStates or (None,) * len(states)
+        for control, state, last_state in \
+                zip((self._firstButton, self._prevButton, self._nextButton,
+                     self._lastButton, self._indexField), states, last):
+            if state != last_state:
+                control.setEnabled(state)
+        self._enabledStates = states
+
         text = (str((self._index + 1) if self._one_based else self._index)
                 if have_elements else '')
         # Avoid setting identical text, as this may change the
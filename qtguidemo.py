@@ -11,12 +11,6 @@ import sys
 import importlib
 from argparse import ArgumentParser
 
-# third party imports
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-
-# toolbox imports
-from dltb.util.image import imread
-
 widget_names = {
     'QImageView': 'qtgui.widgets.image.QImageView',
     'QNetworkComboBox': 'qtgui.widgets.network.QNetworkComboBox',
@@ -52,6 +46,14 @@ def main() -> None:
                for name in args.widget]
     print(widgets)
 
+    # Qt and the toolbox are only imported after the command line
+    # arguments have been parsed, so that `--help` or invalid
+    # arguments do not have to wait for these imports.
+    # pylint: disable=import-outside-toplevel
+    from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget,
+                                 QVBoxLayout)
+    from dltb.util.image import imread
+
     app = QApplication(sys.argv[:1])
     if args.window:
         window = QMainWindow()